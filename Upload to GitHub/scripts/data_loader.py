@@ -5,9 +5,16 @@ Loads and structures all CSV files for processing
 
 import pandas as pd
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
 
+# Low-cardinality text columns stored as categoricals, so peer grouping hashes
+# small integer codes instead of repeated strings
+CATEGORICAL_COLUMNS = {
+    'p1_1_1_2': ('district_name', 'p1_1_1_2_grade'),
+}
+
 class DataLoader:
     """Loads ULB data from CSV files"""
     
@@ -15,7 +22,29 @@ class DataLoader:
         self.data_folder = Path(data_folder)
         self.data = {}
         self.ulb_list = []
+        self._by_ulb = {}  # table_name -> {mp_id: rows of that ULB}
+        self._ulb_index = {}  # mp_id -> ulb_list record
         self.logger = logging.getLogger(__name__)
+    
+    def _read_csv(self, filepath):
+        """Read one questionnaire CSV.
+        
+        low_memory=False makes the C parser infer each column's dtype once over
+        the whole file instead of chunk by chunk, which is faster for these
+        wide, small files and avoids mixed-dtype columns. engine='pyarrow' is
+        not used: pyarrow is not a dependency, and its reader infers some
+        columns (e.g. timestamps) differently from the C parser.
+        """
+        return pd.read_csv(filepath, encoding='utf-8-sig', low_memory=False)  # Handle BOM
+        
+    def _load_table(self, candidates):
+        """Read the first loadable (filename, path) candidate; (None, None) if none load"""
+        for filename, filepath in candidates:
+            try:
+                return self._read_csv(filepath), filename
+            except Exception as e:
+                self.logger.warning(f"  ✗ Failed to load {filename}: {str(e)}")
+        return None, None
         
     def load_all_data(self):
         """Load all CSV files and organize by table name"""
@@ -72,70 +101,110 @@ class DataLoader:
             'mp_{}.csv'
         ]
         
+        # List the data folder once; file lookups below are then dict hits
+        # instead of one stat() per candidate name. Names go through normcase
+        # so matching stays case-insensitive on Windows, as exists() was
+        try:
+            with os.scandir(self.data_folder) as it:
+                available = {os.path.normcase(entry.name): entry.path for entry in it if entry.is_file()}
+        except OSError:
+            available = {}
+        
+        # Candidate files per table, primary filename first, then the alternatives
+        candidates = {}
         for table_name, primary_filename in table_files.items():
-            loaded = False
-            
-            # Try primary filename first
-            filepath = self.data_folder / primary_filename
-            if filepath.exists():
-                try:
-                    df = pd.read_csv(filepath, encoding='utf-8-sig')  # Handle BOM
-                    self.data[table_name] = df
-                    self.logger.info(f"  [OK] Loaded {table_name}: {len(df)} rows, {len(df.columns)} columns")
-                    loaded = True
-                    loaded_count += 1
-                except Exception as e:
-                    self.logger.warning(f"  ✗ Failed to load {primary_filename}: {str(e)}")
-            
-            # If primary not found, try alternatives
-            if not loaded:
-                for pattern in alternative_patterns:
-                    alt_filename = pattern.format(table_name)
-                    alt_filepath = self.data_folder / alt_filename
-                    if alt_filepath.exists():
-                        try:
-                            df = pd.read_csv(alt_filepath, encoding='utf-8-sig')
-                            self.data[table_name] = df
-                            self.logger.info(f"  [OK] Loaded {table_name} (from {alt_filename}): {len(df)} rows, {len(df.columns)} columns")
-                            loaded = True
-                            loaded_count += 1
-                            break
-                        except Exception as e:
-                            self.logger.warning(f"  ✗ Failed to load {alt_filename}: {str(e)}")
-            
-            if not loaded:
+            filenames = [primary_filename] + [pattern.format(table_name) for pattern in alternative_patterns]
+            candidates[table_name] = [
+                (filename, available[os.path.normcase(filename)])
+                for filename in filenames
+                if os.path.normcase(filename) in available
+            ]
+        
+        # read_csv releases the GIL while reading and parsing, so the files are
+        # loaded concurrently; results come back in table order for logging
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = executor.map(self._load_table, candidates.values())
+        
+        for (table_name, primary_filename), (df, filename) in zip(table_files.items(), results):
+            if df is None:
                 self.logger.warning(f"  [WARNING] File not found for {table_name} (expected: {primary_filename})")
+                continue
+            
+            self.data[table_name] = df
+            loaded_count += 1
+            if filename == primary_filename:
+                self.logger.info(f"  [OK] Loaded {table_name}: {len(df)} rows, {len(df.columns)} columns")
+            else:
+                self.logger.info(f"  [OK] Loaded {table_name} (from {filename}): {len(df)} rows, {len(df.columns)} columns")
         
         self.logger.info(f"\n[OK] Successfully loaded {loaded_count} out of {len(table_files)} expected files")
         
+        # Before the per-ULB split, so the ULB slices share the categorical dtype
+        self._prepare_categoricals()
+        
+        # Split each table by ULB once so per-ULB lookups are a dict hit
+        # instead of a full-column mask on every rule evaluation
+        self._by_ulb = {
+            table_name: {mp_id: rows for mp_id, rows in df.groupby('mp_id', sort=False)}
+            for table_name, df in self.data.items()
+            if 'mp_id' in df.columns
+        }
+        
         # Extract ULB list from Part 1
         if 'p1_1_1_2' in self.data:
             df_p1 = self.data['p1_1_1_2']
             self.ulb_list = df_p1[['mp_id', 'municipality_name', 'district_name']].to_dict('records')
+            # First record wins, matching a linear search over ulb_list
+            self._ulb_index = {}
+            for ulb in self.ulb_list:
+                self._ulb_index.setdefault(ulb['mp_id'], ulb)
             self.logger.info(f"[OK] Found {len(self.ulb_list)} ULBs")
         else:
             self.logger.error("✗ Part 1 data not found - cannot extract ULB list")
         
         return self.data
     
-    def get_ulb_data(self, mp_id, table_name):
-        """Get data for specific ULB and table"""
+    def _prepare_categoricals(self):
+        """Convert the CATEGORICAL_COLUMNS of the loaded tables to category dtype"""
+        for table_name, columns in CATEGORICAL_COLUMNS.items():
+            df = self.data.get(table_name)
+            if df is None:
+                continue
+            for col in columns:
+                if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+                    df[col] = df[col].astype('category')
+    
+    def get_ulb_data(self, mp_id, table_name, copy=True):
+        """Get data for specific ULB and table.
+        
+        copy=False hands out the loader's own per-ULB frame instead of a copy;
+        it is shared by every later lookup, so the caller must not modify it
+        (the rule engine reads it many times per ULB; tests hold it to that).
+        """
         if table_name not in self.data:
             return None
         
-        df = self.data[table_name]
-        if 'mp_id' not in df.columns:
-            return df  # Return full table if no mp_id column
+        if table_name not in self._by_ulb:
+            return self.data[table_name]  # Return full table if no mp_id column
         
-        ulb_data = df[df['mp_id'] == mp_id].copy()
-        return ulb_data if not ulb_data.empty else None
+        ulb_data = self._by_ulb[table_name].get(mp_id)
+        if ulb_data is None or not copy:
+            return ulb_data
+        return ulb_data.copy()
+    
+    def ulbs_with_rows(self, table_name):
+        """IDs of the ULBs that have rows in a table, or None when the table has
+        no mp_id column (every ULB then gets the whole table)"""
+        if table_name not in self.data:
+            return frozenset()
+        by_ulb = self._by_ulb.get(table_name)
+        if by_ulb is None:
+            return None if not self.data[table_name].empty else frozenset()
+        return by_ulb.keys()
     
     def get_ulb_info(self, mp_id):
         """Get basic info for a ULB"""
-        for ulb in self.ulb_list:
-            if ulb['mp_id'] == mp_id:
-                return ulb
-        return None
+        return self._ulb_index.get(mp_id)
     
     def get_all_ulb_ids(self):
         """Get list of all ULB IDs"""
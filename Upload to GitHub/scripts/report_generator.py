@@ -5,15 +5,151 @@ ULB Audit Framework - Report Generator (with Timestamped Folders)
 """
 
 import pandas as pd
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+import hashlib
 import logging
+import pickle
 from pathlib import Path
+from xml.sax.saxutils import escape
+
+# Paragraph styles shared by every ULB report; built once instead of per PDF
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=16,
+    textColor=colors.HexColor('#1f4788'),
+    spaceAfter=12,
+    alignment=TA_CENTER,
+    fontName='Helvetica-Bold'
+)
+
+_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading2'],
+    fontSize=12,
+    textColor=colors.HexColor('#2e5c8a'),
+    spaceAfter=6,
+    spaceBefore=12,
+    fontName='Helvetica-Bold'
+)
+
+# Header cell style of the Excel reports: bold, thin border, centred - the
+# look pandas' to_excel gave header rows (pandas < 3.0)
+_HEADER_FONT = Font(bold=True)
+_HEADER_BORDER = Border(*(Side(style='thin'),) * 4)
+_HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='top')
+
+# Finding-detail prefixes (text before the first colon) reworded for the report
+DETAIL_PREFIX_REWRITES = {
+    'Cross-table': 'Cross-table comparison failed',
+    'Unable to evaluate': 'Could not evaluate this check',
+}
+
+# Markup of the Observation cell: check description, then the finding detail
+OBSERVATION_TEMPLATE = "%s<br/><b>Finding:</b> %s"
+
+# Section headings for the per-part tables in the ULB report
+PART_NAMES = {
+    '1': 'PART I - DEMOGRAPHICS AND GEOGRAPHY',
+    '2': 'PART II - HUMAN RESOURCES',
+    '3': 'PART III - ACCOUNTS',
+    '4': 'PART IV - TAXATION AND DCB',
+    '5': 'PART V - LIABILITIES',
+    '6': 'PART VI - CAPITAL WORKS',
+    '7': 'PART VII - ASSETS',
+    '8': 'PART VIII - SERVICE LEVELS',
+    '9': 'PART IX - FUTURE NEEDS',
+}
+
+def part_sort_key(part_str):
+    """Order parts numerically; cross-part keys like '3,4' sort by their first part"""
+    try:
+        return int(str(part_str).split(',', 1)[0])
+    except ValueError:
+        return 999
+
+def sheet_sort_key(part_str):
+    """Order the detailed report's part sheets numerically; cross-part keys
+    like '3,4' get sheets after all single parts"""
+    try:
+        return int(str(part_str))
+    except ValueError:
+        return 999
+
+# Severity cell shading in the findings tables
+SEVERITY_COLORS = {
+    'Critical': colors.HexColor('#ff0000'),
+    'High': colors.HexColor('#ffc000'),
+    'Medium': colors.HexColor('#ffff00'),
+    'Low': colors.HexColor('#92d050'),
+}
+
+# Style of the ULB details table at the top of every report
+ULB_INFO_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#e8f0f8')),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+# Fixed part of every findings table style; per-row severity shading is appended
+FINDINGS_TABLE_BASE_STYLE = (
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#366092')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+)
+
+# Findings tables use fixed column widths and are split into tables of at most
+# this many rows; the header row repeats on every page a table runs onto
+FINDINGS_TABLE_COL_WIDTHS = (0.3*inch, 0.8*inch, 0.8*inch, 5*inch)
+FINDINGS_TABLE_MAX_ROWS = 100
+
+# Master report columns: finding field -> sheet header, in sheet order
+DASHBOARD_FINDING_COLUMNS = (
+    ('mp_id', 'ULB_ID'),
+    ('ulb_name', 'Municipality'),
+    ('district', 'District'),
+    ('rule_id', 'Rule_ID'),
+    ('part_no', 'Part'),
+    ('severity', 'Severity'),
+    ('check_type', 'Check_Type'),
+    ('description', 'Validation_Rule'),
+    ('detail', 'Finding_Detail'),
+)
+
+DETAILED_FINDING_COLUMNS = (
+    ('mp_id', 'ULB_ID'),
+    ('ulb_name', 'Municipality'),
+    ('district', 'District'),
+    ('rule_id', 'Rule_ID'),
+    ('severity', 'Severity'),
+    ('description', 'Validation_Rule'),
+    ('detail', 'Finding_Detail'),
+)
+
+NO_FINDINGS_MESSAGE = 'No audit findings. All validations passed.'
 
 class ReportGenerator:
     """Generates audit reports in timestamped folders"""
@@ -24,48 +160,143 @@ class ReportGenerator:
         self.output_folder = Path(output_folder) / f"Audit_{timestamp}"
         self.output_folder.mkdir(parents=True, exist_ok=True)
         self.logger = logging.getLogger(__name__)
-        self.logger.info(f"Reports will be saved to: {self.output_folder}")
-        self.column_map = self._load_column_map()
+        self.logger.info("Reports will be saved to: %s", self.output_folder)
+        self._report_date = datetime.now().strftime("%d-%b-%Y")  # stamped on every report in the run
+        self.column_labels, self.column_sections = self._load_column_map()
+        self._column_ref_cache = {}  # column name -> formatted reference
+
+    @classmethod
+    def _for_worker(cls, output_folder, column_labels, column_sections, report_date):
+        """Rebuild a generator in a worker process from the parent's state,
+        without creating another run folder or re-reading mp-map.xlsx"""
+        generator = cls.__new__(cls)
+        generator.output_folder = Path(output_folder)
+        generator.logger = logging.getLogger(__name__)
+        generator._report_date = report_date
+        generator.column_labels = column_labels
+        generator.column_sections = column_sections
+        generator._column_ref_cache = {}
+        return generator
 
     def _load_column_map(self):
-        """Load optional column label/section mapping from mp-map.xlsx."""
+        """Load optional column label/section mapping from mp-map.xlsx.
+        
+        Returns two flat dicts keyed by column name: (labels, sections).
+        """
         map_path = Path(__file__).resolve().parents[2] / 'mp-map.xlsx'
         if not map_path.exists():
             self.logger.warning("mp-map.xlsx not found. Reports will show raw column names only.")
-            return {}
+            return {}, {}
+
+        # mp-map.xlsx is static across a campaign: reuse the parsed mapping from
+        # the previous run while the sidecar's key (a hash of the workbook's
+        # bytes) still matches; only the key is unpickled unless it does
+        sidecar = map_path.with_suffix('.labels-sections.pkl')
+        cache_key = None
+        try:
+            cache_key = hashlib.sha256(map_path.read_bytes()).hexdigest()
+            with open(sidecar, 'rb') as fh:
+                if pickle.load(fh) == cache_key:
+                    labels, sections = pickle.load(fh)
+                    self.logger.info("[OK] Loaded %d column mappings from mp-map.xlsx (cached)", len(labels))
+                    return labels, sections
+        except FileNotFoundError:
+            pass
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError) as e:
+            self.logger.debug("Ignoring unreadable column map cache %s: %s", sidecar, e)
 
         try:
-            df = pd.read_excel(map_path, sheet_name='consolidated', header=None)
-            mapping = {}
-            for _, row in df.iterrows():
-                col_key = str(row.iloc[0]).strip() if pd.notna(row.iloc[0]) else ''
-                if not col_key:
-                    continue
-                section = str(row.iloc[1]).strip() if pd.notna(row.iloc[1]) else ''
-                label = str(row.iloc[2]).strip() if pd.notna(row.iloc[2]) else ''
-                mapping[col_key] = {
-                    'section': section,
-                    'label': label,
-                }
-            self.logger.info(f"[OK] Loaded {len(mapping)} column mappings from mp-map.xlsx")
-            return mapping
+            # Stream the first three columns as plain values; no DataFrame is needed
+            wb = load_workbook(map_path, read_only=True, data_only=True)
+            try:
+                rows = wb['consolidated'].iter_rows(max_col=3, values_only=True)
+                labels = {}
+                sections = {}
+                for key_val, section_val, label_val in rows:
+                    col_key = self._cell_text(key_val)
+                    if not col_key:
+                        continue
+                    labels[col_key] = self._cell_text(label_val)
+                    sections[col_key] = self._cell_text(section_val)
+            finally:
+                wb.close()
+            if cache_key is not None:
+                try:
+                    with open(sidecar, 'wb') as fh:
+                        pickle.dump(cache_key, fh, protocol=pickle.HIGHEST_PROTOCOL)
+                        pickle.dump((labels, sections), fh, protocol=pickle.HIGHEST_PROTOCOL)
+                except OSError as e:
+                    self.logger.debug("Could not write column map cache: %s", e)
+            self.logger.info("[OK] Loaded %d column mappings from mp-map.xlsx", len(labels))
+            return labels, sections
         except Exception as e:
-            self.logger.warning(f"Unable to load mp-map.xlsx: {str(e)}")
-            return {}
+            self.logger.warning("Unable to load mp-map.xlsx: %s", e)
+            return {}, {}
+
+    @staticmethod
+    def _excel_value(value):
+        """Cell value for a finding field; missing/NaN values become blank cells"""
+        if value is None or (isinstance(value, float) and value != value):
+            return None
+        return value
+
+    def _finding_row(self, finding, columns):
+        return [self._excel_value(finding.get(field)) for field, _ in columns]
+
+    @staticmethod
+    def _header_cells(ws, header):
+        """Styled header row for a write-only sheet"""
+        cells = []
+        for title in header:
+            cell = WriteOnlyCell(ws, value=title)
+            cell.font = _HEADER_FONT
+            cell.border = _HEADER_BORDER
+            cell.alignment = _HEADER_ALIGNMENT
+            cells.append(cell)
+        return cells
+
+    @classmethod
+    def _append_sheet(cls, wb, sheet_name, header, rows):
+        """Stream a styled header row plus data rows into a new write-only sheet"""
+        ws = wb.create_sheet(sheet_name)
+        ws.append(cls._header_cells(ws, header))
+        for row in rows:
+            ws.append(row)
+        return ws
+
+    @staticmethod
+    def _cell_text(value):
+        """Stripped text of a spreadsheet cell value ('' for empty cells)"""
+        if value is None:
+            return ''
+        return str(value).strip()
 
     def _format_column_reference(self, column_name):
-        if pd.isna(column_name) or str(column_name).strip() == '':
+        """Column name with its mp-map label and section, escaped for Paragraph markup"""
+        # Column names are almost always plain strings; only fall back to
+        # pd.isna for the odd NaN / None coming from an empty rule cell
+        if isinstance(column_name, str):
+            column_name = column_name.strip()
+        elif column_name is None or pd.isna(column_name):
+            return ''
+        else:
+            column_name = str(column_name).strip()
+        if not column_name:
             return ''
-        column_name = str(column_name).strip()
-        map_item = self.column_map.get(column_name, {})
-        label = map_item.get('label')
-        section = map_item.get('section')
-        parts = [f"{column_name}"]
-        if label:
-            parts.append(label)
-        if section:
-            parts.append(f"Section: {section}")
-        return " | ".join(parts)
+        # The same few columns recur across every ULB's findings
+        reference = self._column_ref_cache.get(column_name)
+        if reference is None:
+            label = self.column_labels.get(column_name)
+            section = self.column_sections.get(column_name)
+            parts = [column_name]
+            if label:
+                parts.append(label)
+            if section:
+                parts.append(f"Section: {section}")
+            # Escaped once here so the cached text is safe to drop into markup
+            reference = escape(" | ".join(parts))
+            self._column_ref_cache[column_name] = reference
+        return reference
 
     def _build_user_friendly_observation(self, finding):
         col1 = self._format_column_reference(finding.get('column_1'))
@@ -77,10 +308,12 @@ class ReportGenerator:
             refs.append(f"Reference field: {col2}")
 
         detail = str(finding.get('detail', ''))
-        if detail.startswith('Cross-table:'):
-            detail = detail.replace('Cross-table:', 'Cross-table comparison failed:', 1)
-        elif detail.startswith('Unable to evaluate:'):
-            detail = detail.replace('Unable to evaluate:', 'Could not evaluate this check:', 1)
+        prefix, sep, rest = detail.partition(':')
+        if sep and prefix in DETAIL_PREFIX_REWRITES:
+            detail = f"{DETAIL_PREFIX_REWRITES[prefix]}:{rest}"
+        # Details carry comparison operators ("not <= 0.00"); escape them so
+        # Paragraph parses only our own tags instead of recovering from bad markup
+        detail = escape(detail)
 
         if refs:
             detail = f"{detail}<br/><b>Fields:</b><br/>" + "<br/>".join(refs)
@@ -91,68 +324,43 @@ class ReportGenerator:
         filename = f"Audit_Report_{ulb_info['municipality_name'].replace(' ', '_')}_ID{mp_id}.pdf"
         filepath = self.output_folder / filename
         
-        doc = SimpleDocTemplate(str(filepath), pagesize=A4,
-                               topMargin=0.5*inch, bottomMargin=0.5*inch,
-                               leftMargin=0.5*inch, rightMargin=0.5*inch)
-        
         story = []
-        styles = getSampleStyleSheet()
-        
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=16,
-            textColor=colors.HexColor('#1f4788'),
-            spaceAfter=12,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=12,
-            textColor=colors.HexColor('#2e5c8a'),
-            spaceAfter=6,
-            spaceBefore=12,
-            fontName='Helvetica-Bold'
-        )
+        styles = _STYLES
+        title_style = _TITLE_STYLE
+        heading_style = _HEADING_STYLE
         
-        story.append(Paragraph("TAMIL NADU STATE FINANCE COMMISSION", title_style))
-        story.append(Paragraph("ULB Questionnaire Audit Report", title_style))
-        story.append(Spacer(1, 0.2*inch))
+        story.extend([
+            Paragraph("TAMIL NADU STATE FINANCE COMMISSION", title_style),
+            Paragraph("ULB Questionnaire Audit Report", title_style),
+            Spacer(1, 0.2*inch),
+        ])
         
         ulb_info_data = [
             ["Municipality", ulb_info['municipality_name']],
             ["District", ulb_info['district_name']],
             ["ULB ID", str(mp_id)],
-            ["Report Date", datetime.now().strftime("%d-%b-%Y")],
+            ["Report Date", self._report_date],
         ]
         
         ulb_table = Table(ulb_info_data, colWidths=[2*inch, 4*inch])
-        ulb_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#e8f0f8')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
+        ulb_table.setStyle(ULB_INFO_TABLE_STYLE)
         story.append(ulb_table)
         story.append(Spacer(1, 0.3*inch))
         
         story.append(Paragraph("EXECUTIVE SUMMARY", heading_style))
         
+        # One pass over the findings feeds both the summary counts and the
+        # per-part tables below
+        severity_counts = Counter()
+        findings_by_part = defaultdict(list)
+        for f in findings:
+            severity_counts[f['severity']] += 1
+            findings_by_part[f['part_no']].append(f)
+        
         if not findings:
             story.append(Paragraph("No audit observations found. All validations passed successfully.", 
                                  styles['Normal']))
         else:
-            severity_counts = {}
-            for f in findings:
-                sev = f['severity']
-                severity_counts[sev] = severity_counts.get(sev, 0) + 1
-            
             summary_text = f"Total Observations: {len(findings)}<br/>"
             for sev in ['Critical', 'High', 'Medium', 'Low']:
                 if sev in severity_counts:
@@ -164,75 +372,48 @@ class ReportGenerator:
         
         if findings:
             story.append(Paragraph("DETAILED OBSERVATIONS", heading_style))
-            
-            findings_by_part = {}
-            for f in findings:
-                part = f['part_no']
-                if part not in findings_by_part:
-                    findings_by_part[part] = []
-                findings_by_part[part].append(f)
-            
-            def part_sort_key(part_str):
-                try:
-                    return int(str(part_str).split(',')[0])
-                except:
-                    return 999
+            normal_style = styles['Normal']
+            severity_color_get = SEVERITY_COLORS.get
             
             for part in sorted(findings_by_part.keys(), key=part_sort_key):
                 part_findings = findings_by_part[part]
                 
-                part_names = {
-                    '1': 'PART I - DEMOGRAPHICS AND GEOGRAPHY',
-                    '2': 'PART II - HUMAN RESOURCES',
-                    '3': 'PART III - ACCOUNTS',
-                    '4': 'PART IV - TAXATION AND DCB',
-                    '5': 'PART V - LIABILITIES',
-                    '6': 'PART VI - CAPITAL WORKS',
-                    '7': 'PART VII - ASSETS',
-                    '8': 'PART VIII - SERVICE LEVELS',
-                    '9': 'PART IX - FUTURE NEEDS',
-                }
-                
-                part_name = part_names.get(str(part), f'PART {part}')
+                part_name = PART_NAMES.get(str(part), f'PART {part}')
                 story.append(Paragraph(part_name, heading_style))
                 
-                table_data = [['#', 'Rule', 'Severity', 'Observation']]
-                
-                for idx, f in enumerate(part_findings, 1):
-                    obs_text = f"{f['description']}<br/><b>Finding:</b> {self._build_user_friendly_observation(f)}"
-                    table_data.append([
-                        str(idx),
-                        f['rule_id'],
-                        f['severity'],
-                        Paragraph(obs_text, styles['Normal'])
-                    ])
-                
-                findings_table = Table(table_data, colWidths=[0.3*inch, 0.8*inch, 0.8*inch, 5*inch])
-                
-                table_style = [
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#366092')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 10),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                    ('FONTSIZE', (0, 1), (-1, -1), 9),
-                ]
-                
-                for idx in range(1, len(table_data)):
-                    severity = table_data[idx][2]
-                    severity_color = {
-                        'Critical': colors.HexColor('#ff0000'),
-                        'High': colors.HexColor('#ffc000'),
-                        'Medium': colors.HexColor('#ffff00'),
-                        'Low': colors.HexColor('#92d050')
-                    }.get(severity, colors.white)
-                    table_style.append(('BACKGROUND', (2, idx), (2, idx), severity_color))
-                
-                findings_table.setStyle(TableStyle(table_style))
-                story.append(findings_table)
+                # Long parts are laid out as consecutive tables of bounded size so
+                # each wrap/split only measures a limited number of rows
+                for start in range(0, len(part_findings), FINDINGS_TABLE_MAX_ROWS):
+                    table_data = [['#', 'Rule', 'Severity', 'Observation']]
+                    
+                    table_style = list(FINDINGS_TABLE_BASE_STYLE)
+                    
+                    # Shade the severity column while building the rows: one
+                    # BACKGROUND command per run of equal severities, not per row
+                    chunk = part_findings[start:start + FINDINGS_TABLE_MAX_ROWS]
+                    run_start = 1
+                    for row, f in enumerate(chunk, 1):
+                        severity = f['severity']
+                        obs_text = OBSERVATION_TEMPLATE % (
+                            escape(str(f['description'])),
+                            self._build_user_friendly_observation(f)
+                        )
+                        table_data.append([
+                            str(start + row),
+                            f['rule_id'],
+                            severity,
+                            Paragraph(obs_text, normal_style)
+                        ])
+                        if row < len(chunk) and chunk[row]['severity'] == severity:
+                            continue
+                        table_style.append(('BACKGROUND', (2, run_start), (2, row),
+                                            severity_color_get(severity, colors.white)))
+                        run_start = row + 1
+                    
+                    findings_table = Table(table_data, colWidths=FINDINGS_TABLE_COL_WIDTHS,
+                                           repeatRows=1)
+                    findings_table.setStyle(TableStyle(table_style))
+                    story.append(findings_table)
                 story.append(Spacer(1, 0.2*inch))
         
         story.append(Spacer(1, 0.3*inch))
@@ -244,96 +425,153 @@ class ReportGenerator:
         """
         story.append(Paragraph(footer_text, styles['Normal']))
         
-        doc.build(story)
-        self.logger.info(f"[OK] Generated report: {filename}")
+        # Write straight into a file we own so the handle is closed as soon as
+        # the build finishes, then drop the flowables before the next ULB
+        with open(filepath, 'wb') as fh:
+            doc = SimpleDocTemplate(fh, pagesize=A4,
+                                   topMargin=0.5*inch, bottomMargin=0.5*inch,
+                                   leftMargin=0.5*inch, rightMargin=0.5*inch)
+            doc.build(story)
+        story.clear()
+        self.logger.info("[OK] Generated report: %s", filename)
         return filepath
     
+    def generate_all_ulb_reports(self, ulb_list, findings_by_mp, max_workers=1):
+        """Generate the PDF report for every ULB.
+        
+        Reports are built in this process by default; max_workers > 1 opts in
+        to a process pool, whose workers' log records only reach handlers set
+        up in the worker itself (none under spawn, e.g. on Windows).
+        Returns the number of reports generated; failures are logged per ULB.
+        """
+        jobs = [(ulb['mp_id'], ulb, findings_by_mp.get(ulb['mp_id'], [])) for ulb in ulb_list]
+        
+        if max_workers <= 1:
+            results = map(self._generate_ulb_report_safely, jobs)
+            return self._count_generated(results)
+        
+        # Each worker gets the column map once, not once per ULB
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_report_worker,
+            initargs=(str(self.output_folder), self.column_labels,
+                      self.column_sections, self._report_date),
+        ) as executor:
+            results = executor.map(_generate_ulb_report_job, jobs, chunksize=4)
+            return self._count_generated(results)
+    
+    def _generate_ulb_report_safely(self, job):
+        mp_id, ulb, ulb_findings = job
+        try:
+            self.generate_ulb_report(mp_id, ulb, ulb_findings)
+            return ulb['municipality_name'], None
+        except Exception as e:
+            return ulb['municipality_name'], str(e)
+    
+    def _count_generated(self, results):
+        generated = 0
+        for name, error in results:
+            if error is None:
+                generated += 1
+            else:
+                self.logger.error("Failed to generate report for %s: %s", name, error)
+        return generated
+    
     def generate_master_dashboard(self, all_findings, data_loader):
         """Generate master dashboard Excel"""
         filepath = self.output_folder / f"Master_Audit_Dashboard.xlsx"
         
-        with pd.ExcelWriter(str(filepath), engine='openpyxl') as writer:
-            summary_data = []
-            for ulb in data_loader.ulb_list:
-                mp_id = ulb['mp_id']
-                ulb_findings = [f for f in all_findings if f['mp_id'] == mp_id]
-                
-                severity_counts = {'Critical': 0, 'High': 0, 'Medium': 0, 'Low': 0}
-                for f in ulb_findings:
-                    sev = f['severity']
-                    if sev in severity_counts:
-                        severity_counts[sev] += 1
-                
-                summary_data.append({
-                    'ULB_ID': mp_id,
-                    'Municipality': ulb['municipality_name'],
-                    'District': ulb['district_name'],
-                    'Total_Findings': len(ulb_findings),
-                    'Critical': severity_counts['Critical'],
-                    'High': severity_counts['High'],
-                    'Medium': severity_counts['Medium'],
-                    'Low': severity_counts['Low'],
-                })
+        # Write-only workbook: rows stream straight to the file instead of being
+        # staged in DataFrames and a full in-memory workbook first
+        wb = Workbook(write_only=True)
+        
+        # Tally findings per ULB up front instead of rescanning all_findings
+        # for every ULB
+        findings_per_ulb = Counter()
+        severity_by_ulb = defaultdict(Counter)
+        for f in all_findings:
+            findings_per_ulb[f['mp_id']] += 1
+            severity_by_ulb[f['mp_id']][f['severity']] += 1
+        
+        summary_rows = []
+        for ulb in data_loader.ulb_list:
+            mp_id = ulb['mp_id']
+            severity_counts = severity_by_ulb.get(mp_id, Counter())
             
-            df_summary = pd.DataFrame(summary_data)
-            df_summary.to_excel(writer, sheet_name='Summary', index=False)
+            summary_rows.append([
+                mp_id,
+                ulb['municipality_name'],
+                ulb['district_name'],
+                findings_per_ulb[mp_id],
+                severity_counts['Critical'],
+                severity_counts['High'],
+                severity_counts['Medium'],
+                severity_counts['Low'],
+            ])
+        
+        self._append_sheet(wb, 'Summary', [
+            'ULB_ID', 'Municipality', 'District', 'Total_Findings',
+            'Critical', 'High', 'Medium', 'Low'
+        ], summary_rows)
+        
+        if all_findings:
+            header = [title for _, title in DASHBOARD_FINDING_COLUMNS]
+            ws_all = wb.create_sheet('All_Findings')
+            ws_all.append(self._header_cells(ws_all, header))
             
-            if all_findings:
-                df_findings = pd.DataFrame(all_findings)
-                df_findings = df_findings[[
-                    'mp_id', 'ulb_name', 'district', 'rule_id', 'part_no', 
-                    'severity', 'check_type', 'description', 'detail'
-                ]]
-                df_findings.columns = [
-                    'ULB_ID', 'Municipality', 'District', 'Rule_ID', 'Part', 
-                    'Severity', 'Check_Type', 'Validation_Rule', 'Finding_Detail'
-                ]
-                df_findings.to_excel(writer, sheet_name='All_Findings', index=False)
-                
-                for sev in ['Critical', 'High']:
-                    df_sev = df_findings[df_findings['Severity'] == sev]
-                    if not df_sev.empty:
-                        sheet_name = f'{sev}_Priority'
-                        df_sev.to_excel(writer, sheet_name=sheet_name, index=False)
-            else:
-                df_empty = pd.DataFrame({'Message': ['No audit findings. All validations passed.']})
-                df_empty.to_excel(writer, sheet_name='All_Findings', index=False)
+            # One pass: write every finding and keep the priority rows aside
+            priority_rows = {'Critical': [], 'High': []}
+            for f in all_findings:
+                row = self._finding_row(f, DASHBOARD_FINDING_COLUMNS)
+                ws_all.append(row)
+                if f.get('severity') in priority_rows:
+                    priority_rows[f['severity']].append(row)
+            
+            for sev, rows in priority_rows.items():
+                if rows:
+                    self._append_sheet(wb, f'{sev}_Priority', header, rows)
+        else:
+            self._append_sheet(wb, 'All_Findings', ['Message'], [[NO_FINDINGS_MESSAGE]])
         
-        self.logger.info(f"[OK] Generated master dashboard: {filepath.name}")
+        wb.save(str(filepath))
+        self.logger.info("[OK] Generated master dashboard: %s", filepath.name)
         return filepath
     
     def generate_master_tabular_report(self, all_findings, data_loader):
         """Generate detailed tabular master report Excel"""
         filepath = self.output_folder / f"Master_Detailed_Report.xlsx"
         
-        with pd.ExcelWriter(str(filepath), engine='openpyxl') as writer:
-            if all_findings:
-                df_all = pd.DataFrame(all_findings)
-                
-                def part_sort_key(part_str):
-                    try:
-                        return int(str(part_str))
-                    except:
-                        return 999
-                
-                for part_no in sorted(df_all['part_no'].unique(), key=part_sort_key):
-                    df_part = df_all[df_all['part_no'] == part_no]
-                    
-                    df_output = df_part[[
-                        'mp_id', 'ulb_name', 'district', 'rule_id', 
-                        'severity', 'description', 'detail'
-                    ]].copy()
-                    
-                    df_output.columns = [
-                        'ULB_ID', 'Municipality', 'District', 'Rule_ID',
-                        'Severity', 'Validation_Rule', 'Finding_Detail'
-                    ]
-                    
-                    sheet_name = f'Part_{part_no}'[:31]
-                    df_output.to_excel(writer, sheet_name=sheet_name, index=False)
-            else:
-                df_empty = pd.DataFrame({'Message': ['No audit findings. All validations passed.']})
-                df_empty.to_excel(writer, sheet_name='Summary', index=False)
+        wb = Workbook(write_only=True)
+        
+        if all_findings:
+            # Bucket references to the findings themselves; each row is only
+            # materialised as it is appended, so no copy of the data piles up
+            findings_by_part = defaultdict(list)
+            for f in all_findings:
+                findings_by_part[f.get('part_no')].append(f)
+            
+            header = [title for _, title in DETAILED_FINDING_COLUMNS]
+            for part_no in sorted(findings_by_part, key=sheet_sort_key):
+                sheet_name = f'Part_{part_no}'[:31]
+                rows = (self._finding_row(f, DETAILED_FINDING_COLUMNS)
+                        for f in findings_by_part[part_no])
+                self._append_sheet(wb, sheet_name, header, rows)
+        else:
+            self._append_sheet(wb, 'Summary', ['Message'], [[NO_FINDINGS_MESSAGE]])
         
-        self.logger.info(f"[OK] Generated detailed report: {filepath.name}")
+        wb.save(str(filepath))
+        self.logger.info("[OK] Generated detailed report: %s", filepath.name)
         return filepath
+
+
+# Per-process generator used by generate_all_ulb_reports' worker pool
+_worker_generator = None
+
+def _init_report_worker(output_folder, column_labels, column_sections, report_date):
+    global _worker_generator
+    _worker_generator = ReportGenerator._for_worker(
+        output_folder, column_labels, column_sections, report_date
+    )
+
+def _generate_ulb_report_job(job):
+    return _worker_generator._generate_ulb_report_safely(job)
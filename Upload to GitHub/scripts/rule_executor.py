@@ -12,13 +12,122 @@ import pandas as pd
 import numpy as np
 import logging
 import re
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Set, Tuple
 
+# Two-value comparisons used by consistency and cross-table rules:
+# operator -> (fails(val1, val2), failure detail template)
+PAIR_COMPARISONS = {
+    '=': (lambda v1, v2: abs(v1 - v2) > max(abs(v2) * 0.01, 0.01), "{:.2f} != {:.2f}"),
+    '==': (lambda v1, v2: abs(v1 - v2) > max(abs(v2) * 0.01, 0.01), "{:.2f} != {:.2f}"),
+    '>=': (lambda v1, v2: not (v1 >= v2), "{:.2f} not >= {:.2f}"),
+    '<=': (lambda v1, v2: not (v1 <= v2), "{:.2f} not <= {:.2f}"),
+    '>': (lambda v1, v2: not (v1 > v2), "{:.2f} not > {:.2f}"),
+    '<': (lambda v1, v2: not (v1 < v2), "{:.2f} not < {:.2f}"),
+}
+
+# Single-threshold comparisons used by ThresholdChecker.check_threshold:
+# operator -> (passes(value, threshold), failure detail template)
+_THRESHOLD_GT = (lambda v, t: v > t, "{:.2f} not > {}")
+_THRESHOLD_LT = (lambda v, t: v < t, "{:.2f} not < {}")
+_THRESHOLD_GE = (lambda v, t: v >= t, "{:.2f} not >= {}")
+_THRESHOLD_LE = (lambda v, t: v <= t, "{:.2f} not <= {}")
+_THRESHOLD_EQ = (lambda v, t: abs(v - t) <= max(abs(t) * 0.01, 0.01), "{:.2f} != {}")
+_THRESHOLD_NE = (lambda v, t: abs(v - t) > max(abs(t) * 0.01, 0.01), "{:.2f} == {}")
+THRESHOLD_COMPARISONS = {
+    '>': _THRESHOLD_GT, 'gt': _THRESHOLD_GT,
+    '<': _THRESHOLD_LT, 'lt': _THRESHOLD_LT,
+    '>=': _THRESHOLD_GE, 'gte': _THRESHOLD_GE,
+    '<=': _THRESHOLD_LE, 'lte': _THRESHOLD_LE,
+    '==': _THRESHOLD_EQ, '=': _THRESHOLD_EQ, 'eq': _THRESHOLD_EQ,
+    '!=': _THRESHOLD_NE, 'neq': _THRESHOLD_NE,
+}
+
+# Day zero of Excel serial dates (serial 1 = 1899-12-31)
+EXCEL_EPOCH = date(1899, 12, 30)
+
+# Municipality grade patterns, tried in this order by extract_municipality_grade
+ROMAN_GRADE_RE = re.compile(r'GRADE\s+([IVX]+)')
+NAMED_GRADE_RE = re.compile(r'(SELECTION|SPECIAL)\s+GRADE')
+
+# Kinds of calculation error that callers route on (see CalcError)
+ERR_OTHER = 0
+ERR_NON_NUMERIC = 1  # text/categorical data where a number was expected
+ERR_ZERO_BASE = 2    # multi-part denominator/base value is zero (not applicable)
+
+class CalcError(str):
+    """Calculation error message tagged with its ERR_* kind"""
+    
+    def __new__(cls, message: str, code: int = ERR_OTHER):
+        error = super().__new__(cls, message)
+        error.code = code
+        return error
+
+def error_code(error: str) -> int:
+    """ERR_* kind of an error message (ERR_OTHER for plain strings)"""
+    return getattr(error, 'code', ERR_OTHER)
+
+def prefix_error(context: str, error: str) -> CalcError:
+    """Prefix an error message with context, keeping its ERR_* kind"""
+    return CalcError(f"{context}: {error}", error_code(error))
+
+def is_present(value) -> bool:
+    """pd.notna for a single rule-sheet cell (None/NaN/str/number) without
+    pandas' scalar dispatch; NaN is the only value not equal to itself"""
+    try:
+        return value is not None and bool(value == value)
+    except TypeError:
+        return False  # pd.NA
+
+@lru_cache(maxsize=None)
+def parse_col_spec(col_spec: str) -> Tuple[Optional[float], Tuple[str, ...]]:
+    """Parse a stripped column spec once: (constant, ()) for a number, otherwise
+    (None, column names) - one name, or several for a comma-separated sum"""
+    try:
+        return float(col_spec), ()
+    except ValueError:
+        pass
+    if ',' in col_spec:
+        return None, tuple(c.strip() for c in col_spec.split(','))
+    return None, (col_spec,)
+
+@lru_cache(maxsize=None)
+def normalize_table_name(table_ref):
+    """Loaded table name for a rules-sheet table reference, resolved once per
+    distinct reference (e.g. mp_270126_p1_1_1_2 -> p1_1_1_2)"""
+    if str(table_ref).startswith('mp_'):
+        parts = str(table_ref).split('_')
+        if len(parts) > 2:
+            return '_'.join(parts[2:])
+    return table_ref
+
 class CalculationEngine:
     """Handles complex calculations for validation rules"""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        # id(frame) -> (weakref to frame, {('numeric', column) / ('value', spec,
+        # support_sum): cached result})
+        self._frame_cache: Dict[int, Tuple[weakref.ref, Dict[tuple, Any]]] = {}
+    
+    def _cache_for(self, data: pd.DataFrame) -> Dict[tuple, Any]:
+        """Memo of column results for one frame.
+        
+        Rules check and read the same columns of the same (read-only) ULB frames
+        over and over; remember the answers per frame. The weakref makes sure a
+        recycled id never hits a dead frame's entry, and drops the entry with
+        the frame.
+        """
+        key = id(data)
+        frame_ref, cache = self._frame_cache.get(key, (None, None))
+        if frame_ref is None or frame_ref() is not data:
+            cache = {}
+            frame_ref = weakref.ref(data, lambda _, key=key: self._frame_cache.pop(key, None))
+            self._frame_cache[key] = (frame_ref, cache)
+        return cache
     
     def _is_numeric_column(self, col_spec: str, data: pd.DataFrame) -> bool:
         """Check if a column contains numeric data"""
@@ -28,19 +137,23 @@ class CalculationEngine:
         col_spec = str(col_spec).strip()
         
         # Try as constant first
-        try:
-            float(col_spec)
+        constant, _ = parse_col_spec(col_spec)
+        if constant is not None:
             return True
-        except:
-            pass
         
         # Check if column exists
         if col_spec not in data.columns:
             return False
         
-        # Check column data type
-        col_data = data[col_spec]
-        
+        cache = self._cache_for(data)
+        key = ('numeric', col_spec)
+        is_numeric = cache.get(key)
+        if is_numeric is None:
+            is_numeric = cache[key] = self._column_is_numeric(data[col_spec])
+        return is_numeric
+    
+    @staticmethod
+    def _column_is_numeric(col_data: pd.Series) -> bool:
         # If already numeric type, return True
         if pd.api.types.is_numeric_dtype(col_data):
             return True
@@ -57,22 +170,37 @@ class CalculationEngine:
         except (ValueError, TypeError):
             return False
     
+    @staticmethod
+    def _column_sum(col_data: pd.Series) -> float:
+        # Null-skipping total; numeric columns are summed straight from their
+        # float64 values without a to_numeric pass
+        if pd.api.types.is_numeric_dtype(col_data):
+            return np.nansum(col_data.to_numpy(dtype='float64', na_value=np.nan))
+        return pd.to_numeric(col_data, errors='coerce').sum()
+    
     def _get_column_value(self, col_spec: str, data: pd.DataFrame, support_sum: bool = True) -> tuple[Optional[float], Optional[str]]:
         """Extract numeric value from column specification"""
-        if pd.isna(col_spec):
+        if not is_present(col_spec):
             return None, "Column specification is missing"
         
+        # Several rules read the same column of the same ULB frame
         col_spec = str(col_spec).strip()
+        cache = self._cache_for(data)
+        key = ('value', col_spec, support_sum)
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = self._read_column_value(col_spec, data, support_sum)
+        return result
+    
+    def _read_column_value(self, col_spec: str, data: pd.DataFrame, support_sum: bool) -> tuple[Optional[float], Optional[str]]:
+        constant, cols = parse_col_spec(col_spec)
         
-        # Try as constant first
-        try:
-            return float(col_spec), None
-        except:
-            pass
+        # Constant value
+        if constant is not None:
+            return constant, None
         
         # Handle comma-separated columns
-        if ',' in col_spec:
-            cols = [c.strip() for c in col_spec.split(',')]
+        if len(cols) > 1:
             total = 0
             found_any = False
             missing_cols = []
@@ -88,7 +216,7 @@ class CalculationEngine:
                     continue
                 
                 if support_sum:
-                    col_sum = pd.to_numeric(data[col], errors='coerce').sum()
+                    col_sum = self._column_sum(data[col])
                     if pd.notna(col_sum):
                         total += float(col_sum)
                         found_any = True
@@ -99,7 +227,8 @@ class CalculationEngine:
                         found_any = True
             
             if non_numeric_cols:
-                return None, f"Non-numeric columns: {', '.join(non_numeric_cols)} (contains text/categorical data)"
+                return None, CalcError(f"Non-numeric columns: {', '.join(non_numeric_cols)} (contains text/categorical data)",
+                                       ERR_NON_NUMERIC)
             if missing_cols:
                 return None, f"Missing columns: {', '.join(missing_cols)}"
             if not found_any:
@@ -111,10 +240,10 @@ class CalculationEngine:
             return None, f"Column '{col_spec}' not found"
         
         if not self._is_numeric_column(col_spec, data):
-            return None, f"Column '{col_spec}' contains non-numeric data (text/categorical)"
+            return None, CalcError(f"Column '{col_spec}' contains non-numeric data (text/categorical)", ERR_NON_NUMERIC)
         
         if support_sum and len(data) > 1:
-            col_sum = pd.to_numeric(data[col_spec], errors='coerce').sum()
+            col_sum = self._column_sum(data[col_spec])
             if pd.notna(col_sum):
                 return float(col_sum), None
             return None, f"Column '{col_spec}' has only null values"
@@ -149,13 +278,107 @@ class CalculationEngine:
         except Exception as e:
             return None, f"Calculation error ({calc_type}): {str(e)}"
     
+    def calculate_batch(self, calc_type: str, rule: pd.Series, df_all: pd.DataFrame,
+                        group_col: str = 'mp_id') -> Optional[Dict[Any, Optional[float]]]:
+        """Evaluate a calculation for every group of df_all at once.
+        
+        Gives the same values as calling calculate() / _get_column_value() on each
+        group's rows, with None where that would return an error. Returns None
+        (caller falls back to the per-group path) for calculations or columns
+        the vectorized path does not cover: CAGR/growth rates and non-numeric
+        columns.
+        """
+        calc_type = 'none' if pd.isna(calc_type) else str(calc_type).lower().strip()
+        if calc_type == 'none':
+            col_keys = ['column_1']
+        elif calc_type in ('ratio', 'percentage', 'percentage_of', 'difference'):
+            col_keys = ['column_1', 'column_2']
+        elif calc_type == 'sum':
+            col_keys = [k for k in ['column_1', 'column_2', 'column_3', 'column_4'] if pd.notna(rule.get(k))]
+            if not col_keys:
+                return None
+        else:
+            return None
+        
+        grouped = df_all.groupby(group_col, sort=False)
+        sizes = grouped.size()
+        values = []
+        for col_key in col_keys:
+            col_values = self._get_column_values_batch(rule[col_key], df_all, grouped, sizes)
+            if col_values is None:
+                return None
+            values.append(col_values)
+        
+        if calc_type == 'none':
+            result = values[0]
+        elif calc_type == 'ratio':
+            result = values[0] / values[1].where(values[1] != 0)
+        elif calc_type in ('percentage', 'percentage_of'):
+            result = (values[0] / values[1].where(values[1] != 0)) * 100
+        elif calc_type == 'difference':
+            result = values[0] - values[1]
+        else:  # sum
+            result = values[0]
+            for col_values in values[1:]:
+                result = result + col_values
+        
+        return {group: (None if np.isnan(value) else float(value)) for group, value in result.items()}
+    
+    def _get_column_values_batch(self, col_spec: str, df_all: pd.DataFrame, grouped,
+                                 sizes: pd.Series) -> Optional[pd.Series]:
+        """Per-group counterpart of _get_column_value (support_sum=True); NaN marks
+        a group without a value, None means the spec needs the per-group path"""
+        if pd.isna(col_spec):
+            return None
+        
+        constant, cols = parse_col_spec(str(col_spec).strip())
+        if constant is not None:
+            return pd.Series(constant, index=sizes.index)
+        
+        for col in cols:
+            # Object columns are judged per group by sampling a value; leave them
+            # to the per-group path
+            if col not in df_all.columns or not pd.api.types.is_numeric_dtype(df_all[col]):
+                return None
+        
+        if len(cols) > 1:
+            # Column sums treat nulls as 0, exactly like the per-group loop
+            total = pd.Series(0.0, index=sizes.index)
+            for col in cols:
+                total = total + self._column_sums_batch(df_all, col, grouped, sizes)
+            return total
+        
+        # A single column is summed over multi-row groups but read directly
+        # (null stays null) for single-row groups
+        col = cols[0]
+        summed = self._column_sums_batch(df_all, col, grouped, sizes)
+        single = grouped[col].sum(min_count=1).astype(float)
+        return summed.where(sizes > 1, single)
+    
+    @staticmethod
+    def _column_sums_batch(df_all: pd.DataFrame, col: str, grouped, sizes: pd.Series) -> pd.Series:
+        """Per-group _column_sum of a numeric column (nulls count as 0).
+        
+        groupby's sum adds with compensated summation, which can differ from
+        _column_sum's np.nansum in the last bit - enough to flip a value sitting
+        on a threshold. Multi-row groups are therefore re-added with np.nansum
+        over their rows in order; a single row's sum is the value either way.
+        """
+        sums = grouped[col].sum().astype(float)
+        multi_row = (sizes > 1).to_numpy()
+        if multi_row.any():
+            values = df_all[col].to_numpy(dtype='float64', na_value=np.nan)
+            indices = grouped.indices
+            sums.iloc[multi_row] = [np.nansum(values[indices[group]]) for group in sizes.index[multi_row]]
+        return sums
+    
     def _calc_ratio(self, rule: pd.Series, ulb_data: pd.DataFrame) -> tuple[Optional[float], Optional[str]]:
         val1, err1 = self._get_column_value(rule['column_1'], ulb_data)
         if err1:
-            return None, f"Numerator: {err1}"
+            return None, prefix_error("Numerator", err1)
         val2, err2 = self._get_column_value(rule['column_2'], ulb_data)
         if err2:
-            return None, f"Denominator: {err2}"
+            return None, prefix_error("Denominator", err2)
         if val2 == 0:
             return None, "Division by zero"
         return val1 / val2, None
@@ -163,10 +386,10 @@ class CalculationEngine:
     def _calc_percentage(self, rule: pd.Series, ulb_data: pd.DataFrame) -> tuple[Optional[float], Optional[str]]:
         val1, err1 = self._get_column_value(rule['column_1'], ulb_data)
         if err1:
-            return None, f"Numerator: {err1}"
+            return None, prefix_error("Numerator", err1)
         val2, err2 = self._get_column_value(rule['column_2'], ulb_data)
         if err2:
-            return None, f"Denominator: {err2}"
+            return None, prefix_error("Denominator", err2)
         if val2 == 0:
             return None, "Division by zero"
         return (val1 / val2) * 100, None
@@ -179,7 +402,7 @@ class CalculationEngine:
             if pd.notna(rule.get(col_key)):
                 val, err = self._get_column_value(rule[col_key], ulb_data)
                 if err:
-                    return None, f"{col_key}: {err}"
+                    return None, prefix_error(col_key, err)
                 total += val
                 cols_used.append(col_key)
         
@@ -191,19 +414,19 @@ class CalculationEngine:
         """Calculate difference between two values"""
         val1, err1 = self._get_column_value(rule['column_1'], ulb_data)
         if err1:
-            return None, f"First value: {err1}"
+            return None, prefix_error("First value", err1)
         val2, err2 = self._get_column_value(rule['column_2'], ulb_data)
         if err2:
-            return None, f"Second value: {err2}"
+            return None, prefix_error("Second value", err2)
         return val1 - val2, None
     
     def _calc_cagr(self, rule: pd.Series, ulb_data: pd.DataFrame) -> tuple[Optional[float], Optional[str]]:
         val_final, err1 = self._get_column_value(rule['column_1'], ulb_data)
         if err1:
-            return None, f"Final value: {err1}"
+            return None, prefix_error("Final value", err1)
         val_initial, err2 = self._get_column_value(rule['column_2'], ulb_data)
         if err2:
-            return None, f"Initial value: {err2}"
+            return None, prefix_error("Initial value", err2)
         if val_initial <= 0 or val_final <= 0:
             return None, "Values must be positive for CAGR"
         years = 14
@@ -218,10 +441,10 @@ class CalculationEngine:
     def _calc_growth_rate(self, rule: pd.Series, ulb_data: pd.DataFrame) -> tuple[Optional[float], Optional[str]]:
         val_final, err1 = self._get_column_value(rule['column_1'], ulb_data)
         if err1:
-            return None, f"Final value: {err1}"
+            return None, prefix_error("Final value", err1)
         val_initial, err2 = self._get_column_value(rule['column_2'], ulb_data)
         if err2:
-            return None, f"Initial value: {err2}"
+            return None, prefix_error("Initial value", err2)
         if val_initial == 0:
             return None, "Initial value cannot be zero"
         growth = ((val_final - val_initial) / val_initial) * 100
@@ -240,25 +463,31 @@ class ThresholdChecker:
         
         try:
             threshold = float(threshold_spec)
-            if operator in ['>', 'gt']:
-                return value > threshold, f"{value:.2f} not > {threshold}"
-            elif operator in ['<', 'lt']:
-                return value < threshold, f"{value:.2f} not < {threshold}"
-            elif operator in ['>=', 'gte']:
-                return value >= threshold, f"{value:.2f} not >= {threshold}"
-            elif operator in ['<=', 'lte']:
-                return value <= threshold, f"{value:.2f} not <= {threshold}"
-            elif operator in ['==', '=', 'eq']:
-                tolerance = max(abs(threshold) * 0.01, 0.01)
-                return abs(value - threshold) <= tolerance, f"{value:.2f} != {threshold}"
-            elif operator in ['!=', 'neq']:
-                tolerance = max(abs(threshold) * 0.01, 0.01)
-                return abs(value - threshold) > tolerance, f"{value:.2f} == {threshold}"
-            else:
+            comparison = THRESHOLD_COMPARISONS.get(operator)
+            if comparison is None:
                 return True, ""
+            passes, template = comparison
+            if passes(value, threshold):
+                return True, ""
+            # The failure detail is only formatted for values that fail
+            return False, template.format(value, threshold)
         except ValueError:
             return True, f"Invalid threshold: {threshold_spec}"
     
+    def passes_batch(self, values: np.ndarray, threshold_spec: str, rule: pd.Series) -> Optional[np.ndarray]:
+        """Vectorized pass/fail of check_threshold over an array of values;
+        None when the rule's operator or threshold needs the scalar check"""
+        operator = str(rule.get('operator', '')).strip().lower()
+        comparison = THRESHOLD_COMPARISONS.get(operator)
+        if comparison is None:
+            return None
+        try:
+            threshold = float(str(threshold_spec).strip())
+        except ValueError:
+            return None
+        passes, _ = comparison
+        return passes(values, threshold)
+    
     def _check_between(self, value: float, threshold_spec: str) -> tuple[bool, str]:
         try:
             parts = threshold_spec.split('|')
@@ -279,9 +508,11 @@ class ThresholdChecker:
 class StatisticalEngine:
     """Handles statistical outlier detection and peer comparison (Phase 4)"""
     
-    def __init__(self, data_loader, calc_engine):
+    def __init__(self, data_loader, calc_engine, all_ulb_ids: Optional[Tuple] = None):
         self.data_loader = data_loader
         self.calc_engine = calc_engine
+        # ULB ids in loader order, read once rather than on every rule
+        self.all_ulb_ids = tuple(data_loader.get_all_ulb_ids()) if all_ulb_ids is None else all_ulb_ids
         self.logger = logging.getLogger(__name__)
     
     def extract_municipality_grade(self, ulb_name: str) -> Optional[str]:
@@ -292,12 +523,12 @@ class StatisticalEngine:
         ulb_name = str(ulb_name).upper()
         
         # Pattern 1: "GRADE I", "GRADE II", etc.
-        match = re.search(r'GRADE\s+([IVX]+)', ulb_name)
+        match = ROMAN_GRADE_RE.search(ulb_name)
         if match:
             return f"Grade {match.group(1)}"
         
         # Pattern 2: "Selection Grade", "Special Grade"
-        match = re.search(r'(SELECTION|SPECIAL)\s+GRADE', ulb_name)
+        match = NAMED_GRADE_RE.search(ulb_name)
         if match:
             return f"{match.group(1).capitalize()} Grade"
         
@@ -322,8 +553,7 @@ class StatisticalEngine:
         elif peer_group_by == 'municipality_grade':
             return self._group_by_municipality_grade()
         else:  # 'none' or null
-            all_ulb_ids = self.data_loader.get_all_ulb_ids()
-            return {'statewide': all_ulb_ids}
+            return {'statewide': self.all_ulb_ids}
     
     def _group_by_population(self, rule: pd.Series) -> Dict[str, List[str]]:
         """Group ULBs by population range"""
@@ -332,8 +562,7 @@ class StatisticalEngine:
         
         if pd.isna(pop_min) or pd.isna(pop_max):
             self.logger.warning(f"Population bounds missing for rule {rule['checkpoint_id']}, using statewide")
-            all_ulb_ids = self.data_loader.get_all_ulb_ids()
-            return {'statewide': all_ulb_ids}
+            return {'statewide': self.all_ulb_ids}
         
         pop_min = float(pop_min)
         pop_max = float(pop_max)
@@ -350,13 +579,11 @@ class StatisticalEngine:
             self.logger.error(f"Population column '{pop_col}' not found")
             return {}
         
-        # Filter ULBs in population range
-        df_filtered = df_p1[
-            (pd.to_numeric(df_p1[pop_col], errors='coerce') >= pop_min) &
-            (pd.to_numeric(df_p1[pop_col], errors='coerce') <= pop_max)
-        ]
+        # Filter ULBs in population range (convert the column once, mask twice)
+        population = pd.to_numeric(df_p1[pop_col], errors='coerce').to_numpy()
+        in_range = (population >= pop_min) & (population <= pop_max)
         
-        ulb_ids = df_filtered['mp_id'].tolist()
+        ulb_ids = df_p1['mp_id'].to_numpy()[in_range].tolist()
         group_name = f"pop_{int(pop_min/1000)}k-{int(pop_max/1000)}k"
         
         return {group_name: ulb_ids}
@@ -373,10 +600,11 @@ class StatisticalEngine:
             self.logger.error("district_name column not found")
             return {}
         
+        # One grouped pass (on category codes) instead of a mask per district;
+        # groups keep the districts' order of first appearance
         groups = {}
-        for district in df_p1['district_name'].dropna().unique():
-            ulb_ids = df_p1[df_p1['district_name'] == district]['mp_id'].tolist()
-            groups[str(district)] = ulb_ids
+        for district, ulb_ids in df_p1['mp_id'].groupby(df_p1['district_name'], sort=False, observed=True):
+            groups[str(district)] = ulb_ids.tolist()
         
         return groups
     
@@ -394,24 +622,23 @@ class StatisticalEngine:
             self.logger.error(f"{grade_col} column not found for grade grouping")
             return {}
 
-        groups = {}
-        for _, row in df_p1.iterrows():
-            grade = row[grade_col]
-            if pd.notna(grade):
-                grade = str(grade).strip()
-                groups.setdefault(grade, []).append(row['mp_id'])
-            if grade:
-                if grade not in groups:
-                    groups[grade] = []
-                groups[grade].append(row['mp_id'])
-        
-        return groups
+        # Each ULB belongs to exactly one grade; blank and missing grades form no group
+        grades = df_p1[grade_col].dropna().astype(str).str.strip()
+        grades = grades[grades != '']
+        return {
+            grade: ulb_ids.tolist()
+            for grade, ulb_ids in df_p1.loc[grades.index, 'mp_id'].groupby(grades, sort=False)
+        }
     
     def collect_metrics_for_rule(self, rule: pd.Series) -> Dict[str, Optional[float]]:
         """Collect metric values across all ULBs for a statistical rule"""
+        metrics = self._collect_metrics_batch(rule)
+        if metrics is not None:
+            return metrics
+        
         metrics = {}
         
-        for mp_id in self.data_loader.get_all_ulb_ids():
+        for mp_id in self.all_ulb_ids:
             ulb_data = self._get_ulb_data_for_rule(mp_id, rule)
             if ulb_data is None or ulb_data.empty:
                 metrics[mp_id] = None
@@ -423,6 +650,33 @@ class StatisticalEngine:
         
         return metrics
     
+    def _collect_metrics_batch(self, rule: pd.Series) -> Optional[Dict[str, Optional[float]]]:
+        """Compute the rule's metric for all ULBs in one grouped pass over the
+        primary table; None when the rule needs the per-ULB path"""
+        if str(rule.get('multi_part', 'No')).lower() == 'yes':
+            return None
+        
+        primary_table = rule.get('primary_table')
+        if pd.isna(primary_table):
+            return None
+        
+        primary_table = normalize_table_name(primary_table)
+        
+        df_all = self.data_loader.data.get(primary_table)
+        if df_all is None or 'mp_id' not in df_all.columns:
+            return None
+        
+        try:
+            values = self.calc_engine.calculate_batch(rule.get('calculation_type'), rule, df_all)
+        except Exception as e:
+            self.logger.debug(f"Vectorized metrics unavailable for {rule['checkpoint_id']}: {str(e)}")
+            return None
+        if values is None:
+            return None
+        
+        # ULBs without rows in the table have no metric
+        return {mp_id: values.get(mp_id) for mp_id in self.all_ulb_ids}
+    
     def _get_ulb_data_for_rule(self, mp_id: str, rule: pd.Series) -> Optional[pd.DataFrame]:
         """Get ULB data considering multi-part rules"""
         primary_table = rule.get('primary_table')
@@ -430,12 +684,9 @@ class StatisticalEngine:
             return None
         
         # Extract table name from full name (e.g., mp_270126_p1_1_1_2 -> p1_1_1_2)
-        if str(primary_table).startswith('mp_'):
-            parts = str(primary_table).split('_')
-            if len(parts) > 2:
-                primary_table = '_'.join(parts[2:])
+        primary_table = normalize_table_name(primary_table)
         
-        return self.data_loader.get_ulb_data(mp_id, primary_table)
+        return self.data_loader.get_ulb_data(mp_id, primary_table, copy=False)
     
     def _calculate_metric(self, rule: pd.Series, ulb_data: pd.DataFrame, mp_id: str) -> Optional[float]:
         """Calculate metric value for a ULB"""
@@ -468,33 +719,40 @@ class StatisticalEngine:
             return primary_data
         
         # Extract table name
-        if str(ref_table).startswith('mp_'):
-            parts = str(ref_table).split('_')
-            if len(parts) > 2:
-                ref_table = '_'.join(parts[2:])
+        ref_table = normalize_table_name(ref_table)
         
-        ref_data = self.data_loader.get_ulb_data(mp_id, ref_table)
+        ref_data = self.data_loader.get_ulb_data(mp_id, ref_table, copy=False)
         if ref_data is None or ref_data.empty:
             return None
         
         # Merge on mp_id if both have it, otherwise assume single-row tables
         if 'mp_id' in primary_data.columns and 'mp_id' in ref_data.columns:
-            merged = pd.merge(primary_data, ref_data, on='mp_id', how='left', suffixes=('', '_ref'))
+            if len(primary_data) == 1 and len(ref_data) == 1:
+                # One row each for the same ULB: line the columns up side by side
+                # (as the merge would, with clashing reference columns suffixed)
+                # without building merge hash tables
+                ref_data = ref_data.drop(columns='mp_id').rename(
+                    columns=lambda c: f"{c}_ref" if c in primary_data.columns else c
+                )
+                merged = pd.concat([primary_data.reset_index(drop=True), ref_data.reset_index(drop=True)], axis=1)
+            else:
+                merged = pd.merge(primary_data, ref_data, on='mp_id', how='left', suffixes=('', '_ref'))
         else:
             # For single-row tables, just concatenate columns
             merged = pd.concat([primary_data.reset_index(drop=True), ref_data.reset_index(drop=True)], axis=1)
         
         return merged
     
-    def calculate_iqr_bounds(self, values: List[float], multiplier: float = 1.5) -> Dict[str, float]:
-        """Calculate IQR-based outlier bounds"""
-        values_array = np.array([v for v in values if v is not None])
+    def calculate_iqr_bounds(self, values: np.ndarray, multiplier: float = 1.5) -> Dict[str, float]:
+        """Calculate IQR-based outlier bounds (NaN entries are treated as missing)"""
+        values_array = np.asarray(values, dtype=float)
+        values_array = values_array[~np.isnan(values_array)]
         
         if len(values_array) < 4:  # Need at least 4 values for quartiles
             return None
         
-        q1 = np.percentile(values_array, 25)
-        q3 = np.percentile(values_array, 75)
+        # Both quartiles from a single sort of the peer values
+        q1, q3 = np.percentile(values_array, [25, 75])
         iqr = q3 - q1
         
         lower_bound = q1 - (multiplier * iqr)
@@ -510,9 +768,10 @@ class StatisticalEngine:
             'n': len(values_array)
         }
     
-    def calculate_zscore_bounds(self, values: List[float], stddev_limit: float = 2.0) -> Dict[str, float]:
-        """Calculate Z-score based outlier bounds"""
-        values_array = np.array([v for v in values if v is not None])
+    def calculate_zscore_bounds(self, values: np.ndarray, stddev_limit: float = 2.0) -> Dict[str, float]:
+        """Calculate Z-score based outlier bounds (NaN entries are treated as missing)"""
+        values_array = np.asarray(values, dtype=float)
+        values_array = values_array[~np.isnan(values_array)]
         
         if len(values_array) < 3:  # Need at least 3 values for meaningful stats
             return None
@@ -549,21 +808,37 @@ class StatisticalEngine:
         findings = []
         validation_type = str(rule['validation_type']).lower().strip()
         
+        # Rule-level finding fields are the same for every outlier; build them once
+        rule_fields = {
+            'rule_id': rule['checkpoint_id'],
+            'part_no': str(rule.get('part', '')),
+            'severity': str(rule['severity']).capitalize() if pd.notna(rule.get('severity')) else 'Medium',
+            'check_type': validation_type,
+            'description': rule['description'],
+        }
+        context_suffix = (f" | Context: {rule['statistical_context']}"
+                          if pd.notna(rule.get('statistical_context')) else '')
+        
         for group_name, ulb_ids in peer_groups.items():
-            # Get metrics for this group
-            group_metrics = {uid: all_metrics.get(uid) for uid in ulb_ids if all_metrics.get(uid) is not None}
+            # Look each ULB's metric up once; the same (mp_id, value) pairs feed
+            # both the bounds and the outlier scan below. A ULB listed twice
+            # (e.g. a duplicated Part 1 row) counts once, in first-seen order
+            present = [(uid, value) for uid in dict.fromkeys(ulb_ids)
+                       if (value := all_metrics.get(uid)) is not None]
             
-            if len(group_metrics) < 3:
-                self.logger.warning(f"  Insufficient data for group '{group_name}' ({len(group_metrics)} ULBs), skipping")
+            if len(present) < 3:
+                self.logger.warning(f"  Insufficient data for group '{group_name}' ({len(present)} ULBs), skipping")
                 continue
             
+            metric_array = np.fromiter((value for _, value in present), dtype=float, count=len(present))
+            
             # Calculate bounds
             if validation_type == 'outlier_iqr':
                 multiplier = float(rule.get('iqr_multiplier', 1.5))
-                bounds = self.calculate_iqr_bounds(list(group_metrics.values()), multiplier)
+                bounds = self.calculate_iqr_bounds(metric_array, multiplier)
             elif validation_type == 'outlier_zscore':
                 stddev_limit = float(rule.get('stddev_limit', 2.0))
-                bounds = self.calculate_zscore_bounds(list(group_metrics.values()), stddev_limit)
+                bounds = self.calculate_zscore_bounds(metric_array, stddev_limit)
             else:
                 self.logger.error(f"  Unknown statistical validation type: {validation_type}")
                 continue
@@ -572,29 +847,23 @@ class StatisticalEngine:
                 self.logger.warning(f"  Could not calculate bounds for group '{group_name}'")
                 continue
             
-            # Evaluate each ULB in the group
-            for mp_id in ulb_ids:
-                metric_value = all_metrics.get(mp_id)
-                if metric_value is None:
-                    continue
-                
-                # Check if outlier
-                is_outlier = (metric_value < bounds['lower_bound']) or (metric_value > bounds['upper_bound'])
-                
-                if is_outlier:
-                    finding = self._create_statistical_finding(
-                        mp_id, rule, metric_value, bounds, group_name, validation_type
-                    )
-                    findings.append(finding)
+            # Flag the whole group's outliers at once, then build findings only for them
+            outliers = (metric_array < bounds['lower_bound']) | (metric_array > bounds['upper_bound'])
+            for i in np.flatnonzero(outliers):
+                mp_id, metric_value = present[i]
+                finding = self._create_statistical_finding(
+                    mp_id, rule_fields, metric_value, bounds, group_name, validation_type, context_suffix
+                )
+                findings.append(finding)
         
         self.logger.info(f"  [OK] Found {len(findings)} statistical outliers")
         return findings
     
-    def _create_statistical_finding(self, mp_id: str, rule: pd.Series, value: float, 
-                                    bounds: Dict, group_name: str, validation_type: str) -> Dict[str, Any]:
-        """Create a finding for statistical outlier"""
+    def _create_statistical_finding(self, mp_id: str, rule_fields: Dict[str, Any], value: float,
+                                    bounds: Dict, group_name: str, validation_type: str,
+                                    context_suffix: str = '') -> Dict[str, Any]:
+        """Create a finding for statistical outlier from the rule's precomputed fields"""
         ulb_info = self.data_loader.get_ulb_info(mp_id)
-        severity = str(rule['severity']).capitalize() if pd.notna(rule.get('severity')) else 'Medium'
         
         # Determine if above or below bounds
         if value < bounds['lower_bound']:
@@ -617,20 +886,12 @@ class StatisticalEngine:
                      f"mean={bounds['mean']:.2f}, std={bounds['std']:.2f}, "
                      f"peer group: {group_name}, N={bounds['n']})")
         
-        # Add statistical context if available
-        if pd.notna(rule.get('statistical_context')):
-            detail += f" | Context: {rule['statistical_context']}"
-        
         return {
             'mp_id': mp_id,
             'ulb_name': ulb_info['municipality_name'] if ulb_info else f'ID{mp_id}',
             'district': ulb_info['district_name'] if ulb_info else '',
-            'rule_id': rule['checkpoint_id'],
-            'part_no': str(rule.get('part', '')),
-            'severity': severity,
-            'check_type': validation_type,
-            'description': rule['description'],
-            'detail': detail
+            **rule_fields,
+            'detail': detail + context_suffix
         }
 
 
@@ -642,9 +903,21 @@ class RuleExecutor:
         self.data_loader = data_loader
         self.calc_engine = CalculationEngine()
         self.threshold_checker = ThresholdChecker()
-        self.statistical_engine = StatisticalEngine(data_loader, self.calc_engine)
+        self.all_ulb_ids = tuple(data_loader.get_all_ulb_ids())
+        self.statistical_engine = StatisticalEngine(data_loader, self.calc_engine, self.all_ulb_ids)
         self.logger = logging.getLogger(__name__)
         self.logged_errors: Set[str] = set()
+        # (table, column) -> ULBs whose rows are all null or all zero there
+        self._missing_cache: Dict[Tuple[str, str], Set[Any]] = {}
+        self._year_rules = self._find_year_rules(rules_df)
+        # validation_type -> per-ULB check (threshold/cross-table rules)
+        self._validation_checks = {
+            'threshold': self._check_threshold_rule,
+            'consistency': self._check_consistency_rule,
+            'completeness': self._check_completeness_rule,
+            'cross_table': self._check_cross_table_rule,
+            'percentage': self._check_threshold_rule,
+        }
     
     def _log_unique_error(self, error_key: str, message: str):
         """Log error only once per unique key"""
@@ -652,83 +925,220 @@ class RuleExecutor:
             self.logger.warning(message)
             self.logged_errors.add(error_key)
     
-    def execute_all_ulbs(self) -> List[Dict[str, Any]]:
-        """Execute all enabled rules across all ULBs"""
+    def execute_all_ulbs(self, max_workers: int = 1) -> List[Dict[str, Any]]:
+        """Execute all enabled rules across all ULBs.
+        
+        Rules run in this process by default. max_workers > 1 opts in to a
+        process pool; worker log records then only reach handlers the worker
+        process itself has (none under spawn, e.g. on Windows), and duplicate
+        warnings are suppressed per worker. Findings come back in rule order
+        (threshold rules, then statistical rules) either way.
+        """
         all_findings = []
-        enabled_rules = self.rules_df[self.rules_df['enabled'] == True]
-        
-        self.logger.info(f"\nExecuting {len(enabled_rules)} enabled rules...")
-        
-        # Separate statistical and threshold rules
-        statistical_rules = enabled_rules[
-            enabled_rules['validation_type'].isin(['outlier_iqr', 'outlier_zscore'])
-        ]
-        threshold_rules = enabled_rules[
-            ~enabled_rules['validation_type'].isin(['outlier_iqr', 'outlier_zscore'])
-        ]
-        
-        # Execute threshold/cross-table rules (existing logic)
-        if len(threshold_rules) > 0:
-            self.logger.info(f"\n[1/2] Executing {len(threshold_rules)} threshold/cross-table rules...")
-            for _, rule in threshold_rules.iterrows():
-                findings = self._execute_threshold_rule_all_ulbs(rule)
-                all_findings.extend(findings)
-        
-        # Execute statistical rules (new Phase 4 logic)
-        if len(statistical_rules) > 0:
-            self.logger.info(f"\n[2/2] Executing {len(statistical_rules)} statistical rules...")
-            for _, rule in statistical_rules.iterrows():
-                findings = self.statistical_engine.evaluate_statistical_rule(rule)
-                all_findings.extend(findings)
+        enabled = (self.rules_df['enabled'] == True).to_numpy()
+        
+        self.logger.info(f"\nExecuting {enabled.sum()} enabled rules...")
+        
+        # Separate statistical and threshold rules (row positions in rules_df)
+        is_statistical = self.rules_df['validation_type'].isin(['outlier_iqr', 'outlier_zscore']).to_numpy()
+        statistical_rules = np.flatnonzero(enabled & is_statistical)
+        threshold_rules = np.flatnonzero(enabled & ~is_statistical)
+        
+        executor = None
+        if max_workers > 1:
+            # Each worker gets the rules and loaded data once, not once per rule
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_rule_worker,
+                initargs=(self.rules_df, self.data_loader),
+            )
+        
+        try:
+            # Execute threshold/cross-table rules
+            if len(threshold_rules) > 0:
+                self.logger.info(f"\n[1/2] Executing {len(threshold_rules)} threshold/cross-table rules...")
+                for findings in self._map_rule_jobs(executor, False, threshold_rules):
+                    all_findings.extend(findings)
+            
+            # Execute statistical rules (Phase 4)
+            if len(statistical_rules) > 0:
+                self.logger.info(f"\n[2/2] Executing {len(statistical_rules)} statistical rules...")
+                for findings in self._map_rule_jobs(executor, True, statistical_rules):
+                    all_findings.extend(findings)
+        finally:
+            if executor is not None:
+                executor.shutdown()
         
         self.logger.info(f"\n[OK] Total findings across all rules: {len(all_findings)}")
         return all_findings
     
+    def _map_rule_jobs(self, executor, is_statistical: bool, positions):
+        """Findings per rule, in order, from this process or the worker pool"""
+        jobs = [(is_statistical, int(pos)) for pos in positions]
+        if executor is None:
+            return map(self._execute_rule_job, jobs)
+        return executor.map(_execute_rule_job, jobs, chunksize=8)
+    
+    def _execute_rule_job(self, job: Tuple[bool, int]) -> List[Dict[str, Any]]:
+        is_statistical, position = job
+        rule = self.rules_df.iloc[position]
+        if is_statistical:
+            return self.statistical_engine.evaluate_statistical_rule(rule)
+        return self._execute_threshold_rule_all_ulbs(rule)
+    
     def _execute_threshold_rule_all_ulbs(self, rule: pd.Series) -> List[Dict[str, Any]]:
         """Execute a threshold/cross-table rule across all ULBs"""
-        findings = []
+        if str(rule['validation_type']).lower().strip() == 'completeness':
+            findings = self._execute_completeness_rule_batch(rule)
+            if findings is not None:
+                return findings
         
-        for mp_id in self.data_loader.get_all_ulb_ids():
-            finding = self._execute_single_rule(mp_id, rule)
+        findings = []
+        batch = self._calculate_threshold_values_batch(rule)
+        passing = self._passing_ulbs_batch(rule, batch[0]) if batch is not None else set()
+        with_rows = self._ulbs_with_primary_rows(rule) if batch is None else None
+        
+        for mp_id in self.all_ulb_ids:
+            if batch is None:
+                if with_rows is not None and mp_id not in with_rows:
+                    continue  # no primary rows: the per-ULB checks would return None
+                finding = self._execute_single_rule(mp_id, rule)
+            else:
+                values, value_source = batch
+                if mp_id not in values or mp_id in passing:
+                    continue  # no rows for this ULB, or its value passes
+                value = values[mp_id]
+                if value is not None:
+                    finding = self._check_threshold_value(mp_id, rule, value, value_source)
+                else:
+                    # Let the per-ULB path work out (and report) why there is no value
+                    finding = self._execute_single_rule(mp_id, rule)
             if finding:
                 findings.append(finding)
         
         return findings
     
+    def _ulbs_with_primary_rows(self, rule: pd.Series):
+        """ULBs with rows in the rule's primary table (None: every ULB sees it)"""
+        primary_table = rule.get('primary_table')
+        if not is_present(primary_table):
+            return frozenset()
+        return self.data_loader.ulbs_with_rows(normalize_table_name(primary_table))
+    
+    def _calculate_threshold_values_batch(self, rule: pd.Series) -> Optional[Tuple[Dict[Any, Optional[float]], str]]:
+        """Evaluate a threshold rule's value for every ULB with one grouped pass
+        over the primary table; None when the rule needs the per-ULB path.
+        
+        Returns ({mp_id: value or None}, value source label) for the ULBs that
+        have rows in the table.
+        """
+        validation_type = str(rule['validation_type']).lower().strip()
+        if validation_type not in ('threshold', 'percentage'):
+            return None
+        
+        primary_table = rule.get('primary_table')
+        if pd.isna(primary_table):
+            return None
+        
+        primary_table = normalize_table_name(primary_table)
+        
+        df_all = self.data_loader.data.get(primary_table)
+        if df_all is None or 'mp_id' not in df_all.columns:
+            return None
+        
+        calc_type = rule.get('calculation_type')
+        try:
+            values = self.calc_engine.calculate_batch(calc_type, rule, df_all)
+        except Exception as e:
+            self.logger.debug(f"Vectorized evaluation unavailable for {rule['checkpoint_id']}: {str(e)}")
+            return None
+        if values is None:
+            return None
+        
+        if pd.notna(calc_type) and str(calc_type).lower().strip() != 'none':
+            value_source = f"{calc_type} calculation"
+        else:
+            value_source = f"column {rule['column_1']}"
+        return values, value_source
+    
+    def _execute_completeness_rule_batch(self, rule: pd.Series) -> Optional[List[Dict[str, Any]]]:
+        """_check_completeness_rule for every ULB from per-column grouped
+        reductions over the primary table; None when it needs the per-ULB path"""
+        primary_table = rule.get('primary_table')
+        col_spec = rule['column_1']
+        if pd.isna(primary_table) or pd.isna(col_spec):
+            return None
+        
+        primary_table = normalize_table_name(primary_table)
+        df_all = self.data_loader.data.get(primary_table)
+        if df_all is None or 'mp_id' not in df_all.columns:
+            return None
+        
+        cols = [col.strip() for col in str(col_spec).split(',')]
+        missing_by_col = [(col, self._missing_ulbs(primary_table, df_all, col)) for col in cols]
+        
+        findings = []
+        with_rows = self.data_loader.ulbs_with_rows(primary_table)
+        for mp_id in self.all_ulb_ids:
+            if mp_id not in with_rows:
+                continue  # no rows for this ULB
+            missing_cols = [col for col, missing in missing_by_col if missing is None or mp_id in missing]
+            if missing_cols:
+                findings.append(self._create_finding(mp_id, rule, f"Missing/zero: {', '.join(missing_cols)}"))
+        return findings
+    
+    def _missing_ulbs(self, table: str, df_all: pd.DataFrame, col: str) -> Optional[Set[Any]]:
+        """ULBs whose rows of the column are all null or all zero; None when the
+        table has no such column (missing for every ULB)"""
+        if col not in df_all.columns:
+            return None
+        key = (table, col)
+        if key not in self._missing_cache:
+            col_values = df_all[col]
+            mp_ids = df_all['mp_id']
+            all_null = col_values.isna().groupby(mp_ids, sort=False).all()
+            all_zero = (col_values == 0).groupby(mp_ids, sort=False).all()
+            self._missing_cache[key] = set(all_null.index[all_null.to_numpy() | all_zero.to_numpy()])
+        return self._missing_cache[key]
+    
+    def _passing_ulbs_batch(self, rule: pd.Series, values: Dict[Any, Optional[float]]) -> Set[Any]:
+        """ULBs whose batch value passes the threshold, compared in one vectorized
+        step; empty when the rule needs the scalar check for every ULB"""
+        threshold_spec = rule.get('threshold')
+        if pd.isna(threshold_spec) or self._is_year_rule(rule):
+            return set()  # no threshold, or values may need per-value year normalization
+        
+        present = [(mp_id, value) for mp_id, value in values.items() if value is not None]
+        values_array = np.fromiter((value for _, value in present), dtype=float, count=len(present))
+        passed = self.threshold_checker.passes_batch(values_array, threshold_spec, rule)
+        if passed is None:
+            return set()
+        return {present[i][0] for i in np.flatnonzero(passed)}
+    
     def _execute_single_rule(self, mp_id: str, rule: pd.Series) -> Optional[Dict[str, Any]]:
         """Execute a single rule for a single ULB (threshold/cross-table)"""
         primary_table = rule.get('primary_table')
-        if pd.isna(primary_table):
+        if not is_present(primary_table):
             return None
         
         # Extract table name
-        if str(primary_table).startswith('mp_'):
-            parts = str(primary_table).split('_')
-            if len(parts) > 2:
-                primary_table = '_'.join(parts[2:])
+        primary_table = normalize_table_name(primary_table)
         
-        ulb_data = self.data_loader.get_ulb_data(mp_id, primary_table)
+        ulb_data = self.data_loader.get_ulb_data(mp_id, primary_table, copy=False)
         if ulb_data is None or ulb_data.empty:
             return None
         
         validation_type = str(rule['validation_type']).lower().strip()
         
-        if validation_type == 'threshold':
-            return self._check_threshold_rule(mp_id, rule, ulb_data)
-        elif validation_type == 'consistency':
-            return self._check_consistency_rule(mp_id, rule, ulb_data)
-        elif validation_type == 'completeness':
-            return self._check_completeness_rule(mp_id, rule, ulb_data)
-        elif validation_type == 'cross_table':
-            return self._check_cross_table_rule(mp_id, rule, ulb_data)
-        elif validation_type == 'percentage':
-            return self._check_threshold_rule(mp_id, rule, ulb_data)
-        return None
+        check = self._validation_checks.get(validation_type)
+        if check is None:
+            return None
+        return check(mp_id, rule, ulb_data)
     
     def _check_threshold_rule(self, mp_id: str, rule: pd.Series, ulb_data: pd.DataFrame) -> Optional[Dict[str, Any]]:
         calc_type = rule.get('calculation_type')
         
-        if pd.notna(calc_type) and str(calc_type).lower().strip() != 'none':
+        if is_present(calc_type) and str(calc_type).lower().strip() != 'none':
             value, error_msg = self.calc_engine.calculate(calc_type, rule, ulb_data)
             value_source = f"{calc_type} calculation"
             if error_msg and self._is_multi_part_rule(rule):
@@ -739,10 +1149,10 @@ class RuleExecutor:
                 else:
                     error_msg = retry_error
             if error_msg:
-                if "denominator cannot be zero" in error_msg.lower() or "base value cannot be zero" in error_msg.lower():
+                if error_code(error_msg) == ERR_ZERO_BASE:
                     # Not applicable case (e.g., denominator population/staff is zero)
                     return None
-                if "non-numeric" in error_msg.lower() or "text/categorical" in error_msg.lower():
+                if error_code(error_msg) == ERR_NON_NUMERIC:
                     error_key = f"{rule['checkpoint_id']}:non_numeric"
                     self._log_unique_error(error_key, f"Rule {rule['checkpoint_id']} skipped (non-numeric data in {rule['column_1']})")
                     return None
@@ -751,14 +1161,18 @@ class RuleExecutor:
             value, error_msg = self.calc_engine._get_column_value(rule['column_1'], ulb_data)
             value_source = f"column {rule['column_1']}"
             if error_msg:
-                if "non-numeric" in error_msg.lower() or "text/categorical" in error_msg.lower():
+                if error_code(error_msg) == ERR_NON_NUMERIC:
                     error_key = f"{rule['checkpoint_id']}:non_numeric"
                     self._log_unique_error(error_key, f"Rule {rule['checkpoint_id']} skipped (non-numeric data in {rule['column_1']})")
                     return None
                 return self._create_error_finding(mp_id, rule, error_msg)
         
+        return self._check_threshold_value(mp_id, rule, value, value_source)
+    
+    def _check_threshold_value(self, mp_id: str, rule: pd.Series, value: float, value_source: str) -> Optional[Dict[str, Any]]:
+        """Compare a computed rule value against the rule's threshold"""
         threshold_spec = rule.get('threshold')
-        if pd.isna(threshold_spec):
+        if not is_present(threshold_spec):
             return None
 
         value = self._normalize_year_value(rule, value)
@@ -773,12 +1187,31 @@ class RuleExecutor:
         if value is None:
             return None
 
+        if self._is_year_rule(rule) and 30000 <= value <= 60000:
+            # Only the date matters for the year, so whole days are enough
+            return float((EXCEL_EPOCH + timedelta(days=int(value))).year)
+        return value
+
+    @staticmethod
+    def _find_year_rules(rules_df: pd.DataFrame) -> Dict[Any, bool]:
+        """Rule label -> whether its column_1 or description mentions 'year',
+        worked out for the whole rules sheet at once"""
+        if not rules_df.index.is_unique:
+            return {}
+        is_year = pd.Series(False, index=rules_df.index)
+        for col in ('column_1', 'description'):
+            if col in rules_df.columns:
+                text = rules_df[col].map(str).str.lower()
+                is_year |= text.str.contains('year', regex=False)
+        return is_year.to_dict()
+
+    def _is_year_rule(self, rule: pd.Series) -> bool:
+        is_year = self._year_rules.get(rule.name)
+        if is_year is not None:
+            return is_year
         col1 = str(rule.get('column_1', '')).lower()
         desc = str(rule.get('description', '')).lower()
-        if ('year' in col1 or 'year' in desc) and 30000 <= value <= 60000:
-            excel_epoch = pd.Timestamp('1899-12-30')
-            return float((excel_epoch + pd.to_timedelta(value, unit='D')).year)
-        return value
+        return 'year' in col1 or 'year' in desc
 
     def _is_multi_part_rule(self, rule: pd.Series) -> bool:
         return str(rule.get('multi_part', '')).strip().lower() == 'yes'
@@ -786,34 +1219,31 @@ class RuleExecutor:
     def _calculate_with_reference_data(self, mp_id: str, rule: pd.Series, ulb_data: pd.DataFrame) -> tuple[Optional[float], Optional[str]]:
         """Retry calculations for multi-part rules using reference_table data."""
         ref_table = rule.get('reference_table')
-        if pd.isna(ref_table):
+        if not is_present(ref_table):
             return None, "Reference table is missing"
 
-        if str(ref_table).startswith('mp_'):
-            parts = str(ref_table).split('_')
-            if len(parts) > 2:
-                ref_table = '_'.join(parts[2:])
+        ref_table = normalize_table_name(ref_table)
 
-        ref_data = self.data_loader.get_ulb_data(mp_id, ref_table)
+        ref_data = self.data_loader.get_ulb_data(mp_id, ref_table, copy=False)
         if ref_data is None or ref_data.empty:
             return None, "Reference table data not found"
 
         calc_type = str(rule.get('calculation_type', '')).strip().lower()
         val1, err1 = self.calc_engine._get_column_value(rule['column_1'], ulb_data)
         if err1:
-            return None, f"Numerator: {err1}"
+            return None, prefix_error("Numerator", err1)
 
         val2, err2 = self.calc_engine._get_column_value(rule['column_2'], ref_data)
         if err2:
-            return None, f"Denominator: {err2}"
+            return None, prefix_error("Denominator", err2)
 
         if calc_type == 'ratio':
             if val2 == 0:
-                return None, "Denominator cannot be zero"
+                return None, CalcError("Denominator cannot be zero", ERR_ZERO_BASE)
             return val1 / val2, None
         if calc_type in ['percentage', 'percentage_of']:
             if val2 == 0:
-                return None, "Base value cannot be zero"
+                return None, CalcError("Base value cannot be zero", ERR_ZERO_BASE)
             return (val1 / val2) * 100, None
         if calc_type == 'difference':
             return val1 - val2, None
@@ -823,38 +1253,24 @@ class RuleExecutor:
     def _check_consistency_rule(self, mp_id: str, rule: pd.Series, ulb_data: pd.DataFrame) -> Optional[Dict[str, Any]]:
         val1, err1 = self.calc_engine._get_column_value(rule['column_1'], ulb_data)
         if err1:
-            if "non-numeric" in err1.lower():
+            if error_code(err1) == ERR_NON_NUMERIC:
                 return None
             return self._create_error_finding(mp_id, rule, f"Column 1: {err1}")
         
         val2, err2 = self.calc_engine._get_column_value(rule['column_2'], ulb_data)
         if err2:
-            if "non-numeric" in err2.lower():
+            if error_code(err2) == ERR_NON_NUMERIC:
                 return None
             return self._create_error_finding(mp_id, rule, f"Column 2: {err2}")
         
         operator = str(rule.get('operator', '=')).strip()
         try:
-            failed = False
-            if operator in ['=', '==']:
-                tolerance = max(abs(val2) * 0.01, 0.01)
-                failed = abs(val1 - val2) > tolerance
-                detail = f"{val1:.2f} != {val2:.2f}"
-            elif operator == '>=':
-                failed = not (val1 >= val2)
-                detail = f"{val1:.2f} not >= {val2:.2f}"
-            elif operator == '<=':
-                failed = not (val1 <= val2)
-                detail = f"{val1:.2f} not <= {val2:.2f}"
-            elif operator == '>':
-                failed = not (val1 > val2)
-                detail = f"{val1:.2f} not > {val2:.2f}"
-            elif operator == '<':
-                failed = not (val1 < val2)
-                detail = f"{val1:.2f} not < {val2:.2f}"
-            
-            if failed:
-                return self._create_finding(mp_id, rule, f"Consistency: {detail}")
+            comparison = PAIR_COMPARISONS.get(operator)
+            if comparison is not None:
+                fails, detail_template = comparison
+                if fails(val1, val2):
+                    detail = detail_template.format(val1, val2)
+                    return self._create_finding(mp_id, rule, f"Consistency: {detail}")
         except Exception as e:
             return self._create_error_finding(mp_id, rule, f"Consistency error: {str(e)}")
         return None
@@ -864,11 +1280,10 @@ class RuleExecutor:
         if pd.isna(col_spec):
             return None
         
-        col_spec = str(col_spec).strip()
-        cols = [c.strip() for c in col_spec.split(',')] if ',' in col_spec else [col_spec]
-        
+        # One pass over the comma-separated spec; a single column splits to itself
         missing_cols = []
-        for col in cols:
+        for col in str(col_spec).split(','):
+            col = col.strip()
             if col not in ulb_data.columns:
                 missing_cols.append(col)
             else:
@@ -882,51 +1297,31 @@ class RuleExecutor:
     
     def _check_cross_table_rule(self, mp_id: str, rule: pd.Series, ulb_data: pd.DataFrame) -> Optional[Dict[str, Any]]:
         ref_table = rule.get('reference_table')
-        if pd.isna(ref_table):
+        if not is_present(ref_table):
             return None
         
-        if str(ref_table).startswith('mp_'):
-            parts = str(ref_table).split('_')
-            if len(parts) > 2:
-                ref_table = '_'.join(parts[2:])
+        ref_table = normalize_table_name(ref_table)
         
-        ref_data = self.data_loader.get_ulb_data(mp_id, ref_table)
+        ref_data = self.data_loader.get_ulb_data(mp_id, ref_table, copy=False)
         if ref_data is None or ref_data.empty:
             return None
         
         val1, err1 = self.calc_engine._get_column_value(rule['column_1'], ulb_data)
         if err1:
-            if "non-numeric" in err1.lower():
+            if error_code(err1) == ERR_NON_NUMERIC:
                 return None
             return self._create_error_finding(mp_id, rule, f"Primary: {err1}")
         
         val2, err2 = self.calc_engine._get_column_value(rule['column_2'], ref_data)
         if err2:
-            if "non-numeric" in err2.lower():
+            if error_code(err2) == ERR_NON_NUMERIC:
                 return None
             return self._create_error_finding(mp_id, rule, f"Reference: {err2}")
         
         operator = str(rule.get('operator', '=')).strip()
         try:
-            failed = False
-            if operator in ['=', '==']:
-                tolerance = max(abs(val2) * 0.01, 0.01)
-                failed = abs(val1 - val2) > tolerance
-                detail = f"{val1:.2f} != {val2:.2f}"
-            elif operator == '>=':
-                failed = not (val1 >= val2)
-                detail = f"{val1:.2f} not >= {val2:.2f}"
-            elif operator == '<=':
-                failed = not (val1 <= val2)
-                detail = f"{val1:.2f} not <= {val2:.2f}"
-            elif operator == '>':
-                failed = not (val1 > val2)
-                detail = f"{val1:.2f} not > {val2:.2f}"
-            elif operator == '<':
-                failed = not (val1 < val2)
-                detail = f"{val1:.2f} not < {val2:.2f}"
-            
-            if failed:
+            comparison = PAIR_COMPARISONS.get(operator)
+            if comparison is not None and comparison[0](val1, val2):
                 detail_text = (
                     f"Cross-table mismatch: primary column '{rule['column_1']}' = {val1:.2f}, "
                     f"reference column '{rule['column_2']}' = {val2:.2f}"
@@ -977,3 +1372,14 @@ class RuleExecutor:
             'operator': rule.get('operator'),
             'threshold': rule.get('threshold')
         }
+
+
+# Per-process executor used by execute_all_ulbs' worker pool
+_worker_executor = None
+
+def _init_rule_worker(rules_df, data_loader):
+    global _worker_executor
+    _worker_executor = RuleExecutor(rules_df, data_loader)
+
+def _execute_rule_job(job):
+    return _worker_executor._execute_rule_job(job)
@@ -11,8 +11,13 @@ This script orchestrates the complete audit workflow:
 """
 
 import pandas as pd
+import argparse
+import hashlib
 import logging
+import os
+import pickle
 import sys
+from collections import Counter, defaultdict
 from pathlib import Path
 from datetime import datetime
 
@@ -23,6 +28,10 @@ from data_loader import DataLoader
 from rule_executor import RuleExecutor
 from report_generator import ReportGenerator
 
+# Rule attributes drawn from a handful of values; held as categoricals so the
+# rules frame stores small codes and rule filtering compares codes
+RULE_CATEGORICAL_COLUMNS = ('validation_type', 'operator', 'calculation_type', 'multi_part', 'severity')
+
 def setup_logging(log_folder):
     """Setup logging configuration"""
     log_folder = Path(log_folder)
@@ -41,8 +50,58 @@ def setup_logging(log_folder):
     
     return logging.getLogger(__name__)
 
-def main():
+def _is_empty_dir(path):
+    """True if the directory has no entries; stops at the first entry instead
+    of listing the whole folder"""
+    with os.scandir(path) as it:
+        return next(it, None) is None
+
+def load_rules(rules_file, logger):
+    """Read the ValidationRules sheet.
+    
+    The parsed sheet is kept in a pickle next to the workbook, headed by a
+    hash of the workbook's bytes and the pandas version, and reused while both
+    still match; repeat runs then skip the xlsx parse. A copied, checked-out
+    or restored workbook is judged by its content, not its timestamp.
+    """
+    cache = rules_file.with_suffix('.rules.pkl')
+    cache_key = (hashlib.sha256(rules_file.read_bytes()).hexdigest(), pd.__version__)
+    try:
+        with open(cache, 'rb') as fh:
+            # Only the key is unpickled unless it matches this workbook
+            if pickle.load(fh) == cache_key:
+                return pickle.load(fh)
+    except FileNotFoundError:
+        pass
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError) as e:
+        logger.debug("Ignoring unreadable rules cache %s: %s", cache, e)
+    
+    df_rules = pd.read_excel(rules_file, sheet_name='ValidationRules')
+    try:
+        with open(cache, 'wb') as fh:
+            pickle.dump(cache_key, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(df_rules, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logger.debug("Could not write rules cache: %s", e)
+    return df_rules
+
+def parse_args(argv=None):
+    """Command-line options"""
+    parser = argparse.ArgumentParser(description="Run the ULB audit over the CSV files in the data folder")
+    parser.add_argument(
+        '--workers', type=int, default=1,
+        help="worker processes for rule execution and PDF reports "
+             "(default 1: run in this process). "
+             "Log records raised inside workers do not reach the audit log file "
+             "when workers are spawned (e.g. on Windows)")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    return args
+
+def main(argv=None):
     """Main execution function"""
+    args = parse_args(argv)
     
     # Setup paths
     base_dir = Path(__file__).parent.parent
@@ -65,6 +124,8 @@ def main():
     logger.info(f"Base Directory: {base_dir}")
     logger.info(f"Data Directory: {data_dir}")
     logger.info(f"Reports Directory: {reports_dir}")
+    if args.workers > 1:
+        logger.info(f"Worker Processes: {args.workers}")
     
     try:
         # ====================================================================
@@ -80,7 +141,10 @@ def main():
             logger.error("Please ensure ValidationRules_v1_Corrected.xlsx is in the config folder")
             return
         
-        df_rules = pd.read_excel(rules_file, sheet_name='ValidationRules')
+        df_rules = load_rules(rules_file, logger)
+        for col in RULE_CATEGORICAL_COLUMNS:
+            if col in df_rules.columns:
+                df_rules[col] = df_rules[col].astype('category')
         enabled_rules = df_rules[df_rules['enabled'] == True]
         logger.info(f"[OK] Loaded {len(df_rules)} total rules")
         logger.info(f"[OK] {len(enabled_rules)} rules are enabled")
@@ -92,7 +156,7 @@ def main():
         logger.info("STEP 2: Loading ULB Data from CSV Files")
         logger.info("="*80)
         
-        if not data_dir.exists() or not any(data_dir.iterdir()):
+        if not data_dir.exists() or _is_empty_dir(data_dir):
             logger.error(f"Data directory is empty: {data_dir}")
             logger.error("Please place all CSV files in the 'data' folder")
             return
@@ -115,16 +179,13 @@ def main():
         logger.info("="*80)
         
         rule_executor = RuleExecutor(df_rules, data_loader)
-        all_findings = rule_executor.execute_all_ulbs()
+        all_findings = rule_executor.execute_all_ulbs(max_workers=args.workers)
         
         logger.info(f"[OK] Audit execution complete")
         logger.info(f"[OK] Total findings: {len(all_findings)}")
         
         if all_findings:
-            severity_counts = {}
-            for f in all_findings:
-                sev = f['severity']
-                severity_counts[sev] = severity_counts.get(sev, 0) + 1
+            severity_counts = Counter(f['severity'] for f in all_findings)
             
             logger.info("\nFindings by Severity:")
             for sev in ['Critical', 'High', 'Medium', 'Low']:
@@ -140,16 +201,14 @@ def main():
         
         report_generator = ReportGenerator(reports_dir)
         
-        ulb_reports_generated = 0
-        for ulb in data_loader.ulb_list:
-            mp_id = ulb['mp_id']
-            ulb_findings = [f for f in all_findings if f['mp_id'] == mp_id]
-            
-            try:
-                report_generator.generate_ulb_report(mp_id, ulb, ulb_findings)
-                ulb_reports_generated += 1
-            except Exception as e:
-                logger.error(f"Failed to generate report for {ulb['municipality_name']}: {str(e)}")
+        # One pass over the findings rather than one scan per ULB
+        findings_by_mp = defaultdict(list)
+        for f in all_findings:
+            findings_by_mp[f['mp_id']].append(f)
+        
+        ulb_reports_generated = report_generator.generate_all_ulb_reports(
+            data_loader.ulb_list, findings_by_mp, max_workers=args.workers
+        )
         
         logger.info(f"[OK] Generated {ulb_reports_generated} ULB reports")
         
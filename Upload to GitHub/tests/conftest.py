@@ -0,0 +1,119 @@
+"""
+Shared fixtures: a small synthetic questionnaire dataset (with null and zero
+values) and helpers to build rules in the ValidationRules sheet layout
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'scripts'))
+
+from data_loader import DataLoader  # noqa: E402
+
+RULE_COLUMNS = [
+    'checkpoint_id', 'part', 'description', 'validation_type', 'calculation_type',
+    'column_1', 'column_2', 'column_3', 'column_4', 'operator', 'threshold',
+    'time_period', 'multi_part', 'reference_part', 'reference_table', 'inter_ulb',
+    'primary_table', 'enabled', 'severity', 'notes', 'peer_group_by',
+    'peer_population_min', 'peer_population_max', 'outlier_method',
+    'iqr_multiplier', 'stddev_limit', 'statistical_context',
+]
+
+NAN = np.nan
+
+# Part 1: one row per ULB
+PART1 = pd.DataFrame({
+    'mp_id': [101, 102, 103, 104, 105, 106, 107, 108, 109, 110],
+    'municipality_name': [f'Town {i}' for i in range(1, 11)],
+    'district_name': ['Alpha', 'Alpha', 'Beta', 'Beta', 'Beta', 'Gamma', 'Alpha', 'Beta', 'Gamma', 'Gamma'],
+    'p1_1_1_2_grade': ['Grade I', 'Grade II', ' Grade I ', NAN, '  ', 'Grade II',
+                       'Grade I', 'Grade II', 'Grade I', 'Grade II'],
+    'p1_1_1_3_area': [10.0, 0.0, NAN, 25.5, 3.0, 40.0, 12.0, 7.0, 600.0, 9.5],
+    'p1_1_3_4_tot_25_tot': [5000, 12000, 0, NAN, 8000, 30000, 4500, 9000, 250000, 7000],
+    'p1_1_3_4_tot_25_no': [1200, 3000, 0, 500, NAN, 7000, 1100, 2500, 60000, 1700],
+    'p1_1_5_populatn': [300, NAN, 0, 40, 900, 1500, 0, 2200, 9000, 350],
+})
+
+# Part 8: several rows per ULB; 101's rows add up to 0.6000000000000001 with
+# np.nansum but to 0.6 with compensated summation. 107 has no rows.
+PART8 = pd.DataFrame({
+    'mp_id': [101, 101, 101, 102, 102, 103, 104, 104, 104, 104,
+              105, 106, 106, 106, 108, 108, 109, 110, 110],
+    'p8_8_1_5_tot': [0.1, 0.2, 0.3, NAN, NAN, 0.0, 1.5, 0.0, NAN, 2.5,
+                     NAN, 4.0, 5.0, 6.0, 0.0, 0.0, 80.0, 3.3, 1.1],
+    'p8_8_4_1_stot_25': [1.0, 2.0, NAN, 3.0, 0.0, 5.0, 0.0, 0.0, 0.0, 0.0,
+                         7.0, NAN, 2.0, 2.0, 1.0, 1.0, 0.5, 9.0, NAN],
+})
+
+
+def make_rules(*rules):
+    """Rules frame in the ValidationRules sheet layout; fields a rule does not
+    set are null, and every rule is enabled"""
+    rows = [{**dict.fromkeys(RULE_COLUMNS, NAN), 'enabled': True, 'severity': 'High',
+             'description': rule['checkpoint_id'], **rule} for rule in rules]
+    return pd.DataFrame(rows, columns=RULE_COLUMNS)
+
+
+@pytest.fixture
+def data_folder(tmp_path):
+    PART1.to_csv(tmp_path / 'mp_270126_p1_1_1_2.csv', index=False)
+    PART8.to_csv(tmp_path / 'mp_270126_p8.csv', index=False)
+    return tmp_path
+
+
+@pytest.fixture
+def loader(data_folder):
+    data_loader = DataLoader(data_folder)
+    data_loader.load_all_data()
+    return data_loader
+
+
+P1 = 'mp_270126_p1_1_1_2'
+P8 = 'mp_270126_p8'
+
+# One rule per calculation and validation path, over both tables
+RULES = make_rules(
+    {'checkpoint_id': 'T-01', 'part': 1, 'validation_type': 'threshold', 'calculation_type': 'none',
+     'column_1': 'p1_1_1_3_area', 'operator': 'between', 'threshold': '2|500', 'primary_table': P1},
+    {'checkpoint_id': 'T-02', 'part': 1, 'validation_type': 'threshold', 'calculation_type': 'ratio',
+     'column_1': 'p1_1_3_4_tot_25_tot', 'column_2': 'p1_1_1_3_area', 'operator': 'between',
+     'threshold': '300|35000', 'primary_table': P1},
+    {'checkpoint_id': 'T-03', 'part': 1, 'validation_type': 'percentage', 'calculation_type': 'percentage',
+     'column_1': 'p1_1_5_populatn', 'column_2': 'p1_1_3_4_tot_25_tot', 'operator': 'between',
+     'threshold': '5|60', 'primary_table': P1},
+    {'checkpoint_id': 'T-04', 'part': 1, 'validation_type': 'threshold', 'calculation_type': 'sum',
+     'column_1': 'p1_1_1_3_area', 'column_2': 'p1_1_5_populatn', 'operator': '>',
+     'threshold': '0', 'primary_table': P1},
+    {'checkpoint_id': 'T-05', 'part': 1, 'validation_type': 'threshold', 'calculation_type': 'difference',
+     'column_1': 'p1_1_3_4_tot_25_tot', 'column_2': 'p1_1_3_4_tot_25_no', 'operator': '>=',
+     'threshold': '1000', 'primary_table': P1},
+    {'checkpoint_id': 'T-06', 'part': 8, 'validation_type': 'threshold', 'calculation_type': 'none',
+     'column_1': 'p8_8_1_5_tot', 'operator': '<=', 'threshold': '0.6', 'primary_table': P8},
+    {'checkpoint_id': 'T-07', 'part': 8, 'validation_type': 'threshold', 'calculation_type': 'ratio',
+     'column_1': 'p8_8_1_5_tot, p8_8_4_1_stot_25', 'column_2': 'p8_8_4_1_stot_25', 'operator': '<',
+     'threshold': '3', 'primary_table': P8},
+    {'checkpoint_id': 'C-01', 'part': 1, 'validation_type': 'consistency', 'calculation_type': 'none',
+     'column_1': 'p1_1_5_populatn', 'column_2': 'p1_1_3_4_tot_25_tot', 'operator': '<=',
+     'primary_table': P1},
+    {'checkpoint_id': 'M-01', 'part': 8, 'validation_type': 'completeness',
+     'column_1': 'p8_8_1_5_tot, p8_8_4_1_stot_25', 'primary_table': P8},
+    {'checkpoint_id': 'X-01', 'part': 1, 'validation_type': 'cross_table', 'calculation_type': 'ratio',
+     'column_1': 'p8_8_1_5_tot', 'column_2': 'p1_1_1_3_area', 'operator': 'between', 'threshold': '0|1',
+     'multi_part': 'Yes', 'reference_part': 1, 'reference_table': P1, 'primary_table': P8},
+    {'checkpoint_id': 'S-01', 'part': 1, 'validation_type': 'outlier_iqr', 'calculation_type': 'none',
+     'column_1': 'p1_1_3_4_tot_25_tot', 'primary_table': P1, 'peer_group_by': 'none',
+     'iqr_multiplier': 1.5, 'stddev_limit': 2.0},
+    {'checkpoint_id': 'S-02', 'part': 8, 'validation_type': 'outlier_iqr', 'calculation_type': 'ratio',
+     'column_1': 'p8_8_1_5_tot', 'column_2': 'p8_8_4_1_stot_25', 'primary_table': P8,
+     'peer_group_by': 'municipality_grade', 'iqr_multiplier': 1.0, 'stddev_limit': 2.0},
+    {'checkpoint_id': 'S-03', 'part': 8, 'validation_type': 'outlier_zscore', 'calculation_type': 'none',
+     'column_1': 'p8_8_1_5_tot', 'primary_table': P8, 'peer_group_by': 'district',
+     'iqr_multiplier': 1.5, 'stddev_limit': 1.0},
+    {'checkpoint_id': 'S-04', 'part': 1, 'validation_type': 'outlier_zscore', 'calculation_type': 'sum',
+     'column_1': 'p1_1_1_3_area', 'column_2': 'p1_1_5_populatn', 'primary_table': P1,
+     'peer_group_by': 'none', 'iqr_multiplier': 1.5, 'stddev_limit': 1.5},
+)
@@ -0,0 +1,37 @@
+import pandas as pd
+
+from conftest import RULES
+from rule_executor import RuleExecutor
+
+
+def test_get_ulb_data_returns_a_copy(loader):
+    ulb_data = loader.get_ulb_data(101, 'p8')
+    ulb_data['p8_8_1_5_tot'] = 0.0
+    ulb_data['scratch'] = 1
+
+    fresh = loader.get_ulb_data(101, 'p8')
+    assert fresh['p8_8_1_5_tot'].tolist() == [0.1, 0.2, 0.3]
+    assert 'scratch' not in fresh.columns
+
+
+def test_get_ulb_data_missing_ulb_or_table(loader):
+    assert loader.get_ulb_data(107, 'p8') is None
+    assert loader.get_ulb_data(101, 'p3') is None
+
+
+def test_rule_engine_leaves_shared_ulb_frames_untouched(loader):
+    # The rule engine reads the loader's own per-ULB frames (copy=False);
+    # every later rule sees them, so nothing may write to them
+    tables = {name: df.copy() for name, df in loader.data.items()}
+    frames = {
+        (name, mp_id): rows.copy()
+        for name, by_ulb in loader._by_ulb.items()
+        for mp_id, rows in by_ulb.items()
+    }
+
+    RuleExecutor(RULES, loader).execute_all_ulbs()
+
+    for name, df in tables.items():
+        pd.testing.assert_frame_equal(loader.data[name], df)
+    for (name, mp_id), rows in frames.items():
+        pd.testing.assert_frame_equal(loader.get_ulb_data(mp_id, name, copy=False), rows)
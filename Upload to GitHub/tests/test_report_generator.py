@@ -0,0 +1,40 @@
+from collections import defaultdict
+
+from openpyxl import load_workbook
+
+from conftest import RULES
+from report_generator import ReportGenerator
+from rule_executor import RuleExecutor
+
+
+def _generate_pdfs(loader, output_folder, max_workers):
+    findings_by_mp = defaultdict(list)
+    for finding in RuleExecutor(RULES, loader).execute_all_ulbs():
+        findings_by_mp[finding['mp_id']].append(finding)
+    generator = ReportGenerator(output_folder)
+    generated = generator.generate_all_ulb_reports(loader.ulb_list, findings_by_mp, max_workers=max_workers)
+    return generated, sorted(path.name for path in generator.output_folder.glob('*.pdf'))
+
+
+def test_worker_pool_generates_the_same_reports(loader, tmp_path):
+    in_process = _generate_pdfs(loader, tmp_path / 'serial', max_workers=1)
+    pooled = _generate_pdfs(loader, tmp_path / 'pooled', max_workers=2)
+    assert in_process[0] == len(loader.ulb_list)
+    assert pooled == in_process
+
+
+def test_master_workbooks_style_header_rows(loader, tmp_path):
+    findings = RuleExecutor(RULES, loader).execute_all_ulbs()
+    generator = ReportGenerator(tmp_path)
+    paths = [generator.generate_master_dashboard(findings, loader),
+             generator.generate_master_tabular_report(findings, loader)]
+
+    for path in paths:
+        wb = load_workbook(path)
+        for ws in wb.worksheets:
+            for cell in ws[1]:
+                assert cell.font.bold, (path.name, ws.title, cell.value)
+                assert cell.border.left.style == cell.border.bottom.style == 'thin'
+                assert cell.alignment.horizontal == 'center'
+            if ws.max_row > 1:
+                assert not ws.cell(row=2, column=1).font.bold
@@ -0,0 +1,125 @@
+import math
+
+import pandas as pd
+import pytest
+
+from conftest import PART1, RULES
+from data_loader import DataLoader
+from rule_executor import RuleExecutor
+
+
+def _normalized(findings):
+    """Findings with NaN fields as None, so equal findings compare equal"""
+    return [
+        {key: None if isinstance(value, float) and math.isnan(value) else value
+         for key, value in finding.items()}
+        for finding in findings
+    ]
+
+
+def _rules(*kinds):
+    return RULES[RULES['validation_type'].isin(kinds)].reset_index(drop=True)
+
+
+@pytest.fixture
+def per_ulb(monkeypatch):
+    """Build a RuleExecutor whose grouped fast paths are switched off, so every
+    rule runs through the per-ULB baseline"""
+    def build(rules, loader):
+        executor = RuleExecutor(rules, loader)
+        monkeypatch.setattr(executor, '_calculate_threshold_values_batch', lambda rule: None)
+        monkeypatch.setattr(executor, '_execute_completeness_rule_batch', lambda rule: None)
+        monkeypatch.setattr(executor.statistical_engine, '_collect_metrics_batch', lambda rule: None)
+        return executor
+    return build
+
+
+def test_threshold_rules_batch_matches_per_ulb(loader, per_ulb):
+    rules = _rules('threshold', 'percentage')
+    batch = RuleExecutor(rules, loader)
+    for _, rule in rules.iterrows():
+        assert batch._calculate_threshold_values_batch(rule) is not None, rule['checkpoint_id']
+
+    assert _normalized(batch.execute_all_ulbs()) == _normalized(per_ulb(rules, loader).execute_all_ulbs())
+
+
+def test_multi_row_sum_on_threshold_matches_per_ulb(loader, per_ulb):
+    # 101's Part 8 rows add up to 0.6000000000000001 one value at a time, just
+    # over the '<= 0.6' threshold; compensated summation would give 0.6
+    rules = _rules('threshold')
+    rules = rules[rules['checkpoint_id'] == 'T-06'].reset_index(drop=True)
+
+    for executor in (RuleExecutor(rules, loader), per_ulb(rules, loader)):
+        flagged = {f['mp_id'] for f in executor.execute_all_ulbs()}
+        assert 101 in flagged
+
+
+def test_completeness_rules_batch_matches_per_ulb(loader, per_ulb):
+    rules = _rules('completeness')
+    batch = RuleExecutor(rules, loader)
+    for _, rule in rules.iterrows():
+        assert batch._execute_completeness_rule_batch(rule) is not None, rule['checkpoint_id']
+
+    findings = _normalized(batch.execute_all_ulbs())
+    assert findings == _normalized(per_ulb(rules, loader).execute_all_ulbs())
+    # All-null (102, 105), all-zero (103, 108) and one all-zero column (104)
+    assert [f['mp_id'] for f in findings] == [102, 103, 104, 105, 108]
+
+
+def test_statistical_metrics_batch_matches_per_ulb(loader, per_ulb):
+    rules = _rules('outlier_iqr', 'outlier_zscore')
+    batch = RuleExecutor(rules, loader).statistical_engine
+    baseline = per_ulb(rules, loader).statistical_engine
+    for _, rule in rules.iterrows():
+        metrics = batch._collect_metrics_batch(rule)
+        assert metrics is not None, rule['checkpoint_id']
+        assert metrics == baseline.collect_metrics_for_rule(rule), rule['checkpoint_id']
+
+
+def test_all_rules_batch_matches_per_ulb(loader, per_ulb):
+    batch = _normalized(RuleExecutor(RULES, loader).execute_all_ulbs())
+    assert batch == _normalized(per_ulb(RULES, loader).execute_all_ulbs())
+    assert {f['rule_id'] for f in batch} == set(RULES['checkpoint_id'])
+
+
+def test_municipality_grade_groups(loader):
+    # Each ULB sits in exactly one group; grades are stripped, and missing or
+    # blank grades form no group
+    groups = RuleExecutor(RULES, loader).statistical_engine._group_by_municipality_grade()
+    assert groups == {
+        'Grade I': [101, 103, 107, 109],
+        'Grade II': [102, 106, 108, 110],
+    }
+
+
+def test_grade_outliers_are_reported_once(loader):
+    rules = RULES[RULES['peer_group_by'] == 'municipality_grade'].reset_index(drop=True)
+    findings = RuleExecutor(rules, loader).execute_all_ulbs()
+    keys = [(f['rule_id'], f['mp_id']) for f in findings]
+    assert keys and len(keys) == len(set(keys))
+
+
+def test_duplicated_part1_row_counts_once_in_peer_groups(loader, data_folder, per_ulb):
+    # 109 is the statewide outlier; listing it twice must neither add a
+    # second value to its peer groups nor report it twice
+    pd.concat([PART1, PART1.iloc[[8]]]).to_csv(data_folder / 'mp_270126_p1_1_1_2.csv', index=False)
+    duplicated = DataLoader(data_folder)
+    duplicated.load_all_data()
+    assert duplicated.get_all_ulb_ids().count(109) == 2
+
+    rules = _rules('outlier_iqr', 'outlier_zscore')
+    findings = _normalized(RuleExecutor(rules, duplicated).execute_all_ulbs())
+    assert findings == _normalized(per_ulb(rules, duplicated).execute_all_ulbs())
+
+    keys = [(f['rule_id'], f['mp_id']) for f in findings]
+    assert ('S-01', 109) in keys and len(keys) == len(set(keys))
+    group_sizes = {f['rule_id']: f['detail'].rsplit('N=', 1)[1] for f in findings}
+    expected = RuleExecutor(rules, loader).execute_all_ulbs()
+    assert group_sizes == {f['rule_id']: f['detail'].rsplit('N=', 1)[1] for f in expected}
+
+
+def test_worker_pool_matches_in_process(loader):
+    # Findings come back in rule order whether rules run here or in workers
+    in_process = _normalized(RuleExecutor(RULES, loader).execute_all_ulbs())
+    pooled = _normalized(RuleExecutor(RULES, loader).execute_all_ulbs(max_workers=2))
+    assert pooled == in_process